@@ -5,7 +5,7 @@ import sys
 from pathlib import Path
 
 from .config import load_config
-from .preprocess import preprocess_dataset
+from .preprocess import iter_preprocess_dataset
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -29,8 +29,7 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Import error: {e}", file=sys.stderr)
         return 1
 
-    results = preprocess_dataset(config.data_root)
-    errors = [r for r in results if r.status == "error"]
+    errors = [r for r in iter_preprocess_dataset(config.data_root) if r.status == "error"]
     if errors:
         print("Preprocess errors:", file=sys.stderr)
         for r in errors:
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+
+# long_caption.json keeps its small "info" object ahead of the (large) spans,
+# so the GUI can decode the top-level keys from the start of the file one at a
+# time and stop at "info" instead of parsing every caption.
+_HEAD_BYTES = 64 * 1024
+_DECODER = json.JSONDecoder()
+_WS = re.compile(r"\s*")
+
+
+def read_caption_info(caption_path: Path) -> dict[str, Any] | None:
+    # The top-level "info" object ({} when the document has none), or None when
+    # it is not within the first _HEAD_BYTES; the caller then parses the file.
+    with open(caption_path, "rb") as f:
+        head = f.read(_HEAD_BYTES).decode("utf-8", errors="ignore")
+    try:
+        pos = _WS.match(head).end()  # type: ignore[union-attr]
+        if head[pos] != "{":
+            return None
+        pos = _WS.match(head, pos + 1).end()  # type: ignore[union-attr]
+        if head[pos] == "}":
+            return {}
+        while True:
+            if head[pos] != '"':
+                return None
+            key, pos = _DECODER.raw_decode(head, pos)
+            pos = _WS.match(head, pos).end()  # type: ignore[union-attr]
+            if head[pos] != ":":
+                return None
+            pos = _WS.match(head, pos + 1).end()  # type: ignore[union-attr]
+            value, pos = _DECODER.raw_decode(head, pos)
+            if key == "info":
+                return value if isinstance(value, dict) else {}
+            pos = _WS.match(head, pos).end()  # type: ignore[union-attr]
+            if head[pos] == "}":
+                return {}
+            if head[pos] != ",":
+                return None
+            pos = _WS.match(head, pos + 1).end()  # type: ignore[union-attr]
+    except (IndexError, ValueError):
+        return None
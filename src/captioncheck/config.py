@@ -1,31 +1,35 @@
 from __future__ import annotations
 
-import json
 import shlex
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .json_io import read_json
+
 
 @dataclass(frozen=True)
 class ExternalEditorConfig:
-    command: list[str] | None = None
+    # Split once at load time; a tuple keeps the frozen config immutable.
+    command: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True)
 class AppConfig:
     data_root: Path
     external_editor: ExternalEditorConfig
+    preload_next_item: bool = False
+    ffmpeg_hwaccel: str | None = None
 
 
-def _coerce_str_list(value: Any) -> list[str] | None:
+def _coerce_str_tuple(value: Any) -> tuple[str, ...] | None:
     if value is None:
         return None
     if isinstance(value, str):
         parts = shlex.split(value)
-        return parts if parts else None
+        return tuple(parts) if parts else None
     if isinstance(value, list) and all(isinstance(x, str) for x in value):
-        return list(value)
+        return tuple(value)
     raise TypeError("external_editor.command must be a string or list of strings")
 
 
@@ -34,14 +38,21 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         config_path = Path("captioncheck_config.json")
 
     if config_path.exists():
-        raw = json.loads(config_path.read_text(encoding="utf-8"))
+        raw = read_json(config_path)
     else:
         raw = {}
 
     data_root = Path(raw.get("data_root", "data"))
     external_editor_raw = raw.get("external_editor", {}) or {}
     external_editor = ExternalEditorConfig(
-        command=_coerce_str_list(external_editor_raw.get("command")),
+        command=_coerce_str_tuple(external_editor_raw.get("command")),
     )
 
-    return AppConfig(data_root=data_root, external_editor=external_editor)
+    hwaccel = raw.get("ffmpeg_hwaccel")
+
+    return AppConfig(
+        data_root=data_root,
+        external_editor=external_editor,
+        preload_next_item=bool(raw.get("preload_next_item", False)),
+        ffmpeg_hwaccel=str(hwaccel) if hwaccel else None,
+    )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -13,32 +15,112 @@ class DatasetItem:
     long_caption_path: Path
     run_meta_path: Path
     preprocess_status_path: Path
+    # Resolved once at scan time; the GUI uses these as lookup keys and for
+    # ffmpeg, so it never has to call Path.resolve() itself.
+    resolved_dir: Path
+    resolved_dir_str: str
+    resolved_video: str
 
 
-def iter_dataset_items(data_root: Path) -> list[DatasetItem]:
-    items: list[DatasetItem] = []
-    if not data_root.exists():
-        return items
+SKIP_SPORT_DIRS = frozenset({"tmp"})
+_REQUIRED_FILES = frozenset({"segment.mp4", "long_caption.json", "run_meta.json"})
+
+
+def sorted_subdirs(path: Path) -> list[os.DirEntry[str]]:
+    with os.scandir(path) as it:
+        return sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+
+def _event_video_link(path: str | Path) -> bool | None:
+    # None when the directory is not a complete event, otherwise whether its
+    # segment.mp4 is a symlink (read from the same listing, no extra stat).
+    video_is_link = False
+    names = set()
+    with os.scandir(path) as it:
+        for e in it:
+            names.add(e.name)
+            if e.name == "segment.mp4":
+                video_is_link = e.is_symlink()
+    if not _REQUIRED_FILES <= names:
+        return None
+    return video_is_link
+
+
+def is_event_dir(path: str | Path) -> bool:
+    return _event_video_link(path) is not None
+
+
+def make_dataset_item(
+    sport_dir: Path, event: str, resolved_sport_dir: Path | None = None
+) -> DatasetItem:
+    # Pass resolved_sport_dir only when neither the event directory nor its
+    # segment.mp4 is a symlink; the resolved paths are then joined onto it
+    # instead of asking the filesystem.
+    event_dir = sport_dir / event
+    video_path = event_dir / "segment.mp4"
+    if resolved_sport_dir is None:
+        resolved_dir = event_dir.resolve()
+        resolved_video = str(video_path.resolve())
+    else:
+        resolved_dir = resolved_sport_dir / event
+        resolved_video = str(resolved_dir / "segment.mp4")
+    return DatasetItem(
+        sport=sport_dir.name,
+        event=event,
+        dir_path=event_dir,
+        video_path=video_path,
+        long_caption_path=event_dir / "long_caption.json",
+        run_meta_path=event_dir / "run_meta.json",
+        preprocess_status_path=event_dir / "preprocess_status.json",
+        resolved_dir=resolved_dir,
+        resolved_dir_str=str(resolved_dir),
+        resolved_video=resolved_video,
+    )
 
-    for sport_dir in sorted([p for p in data_root.iterdir() if p.is_dir()], key=lambda p: p.name):
-        if sport_dir.name in {"tmp"}:
+
+def scan_sport(sport_dir: Path, resolved_sport_dir: Path | None) -> list[DatasetItem]:
+    # Complete events of one sport; pass resolved_sport_dir unless the sport
+    # directory itself is a symlink.
+    items: list[DatasetItem] = []
+    for e in sorted_subdirs(sport_dir):
+        video_is_link = _event_video_link(e.path)
+        if video_is_link is None:
             continue
-        for event_dir in sorted([p for p in sport_dir.iterdir() if p.is_dir()], key=lambda p: p.name):
-            video_path = event_dir / "segment.mp4"
-            long_caption_path = event_dir / "long_caption.json"
-            run_meta_path = event_dir / "run_meta.json"
-            preprocess_status_path = event_dir / "preprocess_status.json"
-
-            if video_path.exists() and long_caption_path.exists() and run_meta_path.exists():
-                items.append(
-                    DatasetItem(
-                        sport=sport_dir.name,
-                        event=event_dir.name,
-                        dir_path=event_dir,
-                        video_path=video_path,
-                        long_caption_path=long_caption_path,
-                        run_meta_path=run_meta_path,
-                        preprocess_status_path=preprocess_status_path,
-                    )
-                )
+        direct = resolved_sport_dir is not None and not video_is_link and not e.is_symlink()
+        items.append(make_dataset_item(sport_dir, e.name, resolved_sport_dir if direct else None))
     return items
+
+
+def scan_dataset(data_root: Path) -> dict[str, list[DatasetItem]]:
+    # Items grouped by sport, in sport-name then event-name order. Sports
+    # without any complete event are omitted.
+    if not data_root.exists():
+        return {}
+
+    # The root is resolved once; only symlinked entries below it need their
+    # own resolve() call.
+    resolved_root = data_root.resolve()
+    sport_entries = [e for e in sorted_subdirs(data_root) if e.name not in SKIP_SPORT_DIRS]
+    sport_dirs = [data_root / e.name for e in sport_entries]
+    resolved_sport_dirs = [
+        None if e.is_symlink() else resolved_root / e.name for e in sport_entries
+    ]
+    if len(sport_dirs) <= 1:
+        per_sport = list(map(scan_sport, sport_dirs, resolved_sport_dirs))
+    else:
+        # Directory listing is syscall-bound and releases the GIL, so sports
+        # are scanned concurrently; map() keeps the results in sport order.
+        max_workers = min(32, (os.cpu_count() or 4) * 4, len(sport_dirs))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            per_sport = list(pool.map(scan_sport, sport_dirs, resolved_sport_dirs))
+    return {
+        sport_dir.name: items for sport_dir, items in zip(sport_dirs, per_sport) if items
+    }
+
+
+def flatten_items(items_by_sport: dict[str, list[DatasetItem]]) -> list[DatasetItem]:
+    return [item for items in items_by_sport.values() for item in items]
+
+
+def iter_dataset_items(data_root: Path) -> list[DatasetItem]:
+    return flatten_items(scan_dataset(data_root))
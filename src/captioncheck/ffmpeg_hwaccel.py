@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import subprocess
+
+
+HWACCEL_PREFERENCE = ("cuda", "videotoolbox", "vaapi", "d3d11va", "qsv", "dxva2")
+_PROBE_TIMEOUT_S = 5
+
+
+def detect_hwaccel(ffmpeg_path: str, requested: str) -> str | None:
+    # Picks the hwaccel to pass to ffmpeg: `requested` if this ffmpeg build
+    # lists it, or for "auto" the first available one in preference order.
+    # None (software decoding) when the probe fails or times out. Blocks for
+    # up to _PROBE_TIMEOUT_S, so the GUI runs it on a worker thread.
+    try:
+        out = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-hwaccels"],
+            capture_output=True,
+            text=True,
+            timeout=_PROBE_TIMEOUT_S,
+            check=False,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    # The first line is the "Hardware acceleration methods:" header.
+    available = {line.strip() for line in out.splitlines()[1:] if line.strip()}
+    if requested != "auto":
+        return requested if requested in available else None
+    for name in HWACCEL_PREFERENCE:
+        if name in available:
+            return name
+    return None
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import os
+from bisect import bisect_right
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+    Signal,
+)
+
+from ..dataset import DatasetItem, flatten_items
+from .reviewed_delegate import REVIEWED_ROLE
+
+
+_HEADERS = ("Sport/Event", "Reviewed")
+_UNKNOWN = 0xFF
+
+ModelIndex = QModelIndex | QPersistentModelIndex
+
+
+class DatasetTreeModel(QAbstractItemModel):
+    # Two-level tree (sport -> event) over the scanned items, stored as flat
+    # arrays instead of one QTreeWidgetItem per row. Items are kept in the
+    # flattened scan order, so each sport's events are the contiguous range
+    # starting at _sport_starts[sport_row]. Sport indexes carry internalId 0;
+    # event indexes carry their sport row + 1.
+    #
+    # Reviewed flags live in a bytearray. A row whose flag is still unknown
+    # reports None (painted blank) and queues `load_reviewed` on a small thread
+    # pool; the result comes back through _reviewed_loaded, which Qt delivers
+    # on the GUI thread. Only rows the view actually paints touch the disk, in
+    # the order they were painted. Loaded flags are applied every ~50 ms with
+    # one dataChanged per run of adjacent rows, not one per row.
+    #
+    # The reviewed column is user-checkable; a toggle from the view updates the
+    # flag and emits reviewed_toggled so the owner can write it back.
+
+    reviewed_toggled = Signal(int, bool)
+    _reviewed_loaded = Signal(int, bool)
+
+    def __init__(
+        self,
+        items_by_sport: dict[str, list[DatasetItem]],
+        load_reviewed: Callable[[DatasetItem], bool],
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._items = flatten_items(items_by_sport)
+        self._load_reviewed = load_reviewed
+        self._sports: list[str] = list(items_by_sport)
+        self._sport_sizes: list[int] = [len(items) for items in items_by_sport.values()]
+        self._sport_starts: list[int] = []
+        start = 0
+        for size in self._sport_sizes:
+            self._sport_starts.append(start)
+            start += size
+        self._reviewed = bytearray([_UNKNOWN]) * len(self._items)
+        self._pending: set[int] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._loaded: list[tuple[int, bool]] = []
+        self._loaded_timer = QTimer(self)
+        self._loaded_timer.setSingleShot(True)
+        self._loaded_timer.setInterval(50)
+        self._loaded_timer.timeout.connect(self._apply_loaded)
+        self._reviewed_loaded.connect(self._on_reviewed_loaded)
+
+    def index(self, row: int, column: int, parent: ModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        if parent.internalId() == 0:
+            return self.createIndex(row, column, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, index: ModelIndex) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        sport_id = index.internalId()
+        if sport_id == 0:
+            return QModelIndex()
+        return self.createIndex(sport_id - 1, 0, 0)
+
+    def rowCount(self, parent: ModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if not parent.isValid():
+            return len(self._sports)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return self._sport_sizes[parent.row()]
+        return 0
+
+    def columnCount(self, parent: ModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return len(_HEADERS)
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(_HEADERS)
+        ):
+            return _HEADERS[section]
+        return None
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        sport_id = index.internalId()
+        if sport_id == 0:
+            if index.column() == 0 and role == Qt.ItemDataRole.DisplayRole:
+                return self._sports[index.row()]
+            return None
+
+        item_index = self._sport_starts[sport_id - 1] + index.row()
+        if index.column() == 0 and role == Qt.ItemDataRole.DisplayRole:
+            return self._items[item_index].event
+        if index.column() == 1 and role == REVIEWED_ROLE:
+            value = self._reviewed[item_index]
+            if value == _UNKNOWN:
+                self._request_reviewed(item_index)
+                return None
+            return bool(value)
+        return None
+
+    def flags(self, index: ModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and index.internalId() != 0 and index.column() == 1:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def setData(  # noqa: N802
+        self, index: ModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        if role != REVIEWED_ROLE or index.column() != 1:
+            return False
+        item_index = self.item_index(index)
+        if item_index is None:
+            return False
+        reviewed = bool(value)
+        self.set_reviewed(item_index, reviewed)
+        self.reviewed_toggled.emit(item_index, reviewed)
+        return True
+
+    def item_index(self, index: ModelIndex) -> int | None:
+        if not index.isValid():
+            return None
+        sport_id = index.internalId()
+        if sport_id == 0:
+            return None
+        return self._sport_starts[sport_id - 1] + index.row()
+
+    def item(self, index: ModelIndex) -> DatasetItem | None:
+        item_index = self.item_index(index)
+        return None if item_index is None else self._items[item_index]
+
+    def index_for_item(self, item_index: int, column: int = 0) -> QModelIndex:
+        sport_row = bisect_right(self._sport_starts, item_index) - 1
+        row = item_index - self._sport_starts[sport_row]
+        return self.createIndex(row, column, sport_row + 1)
+
+    def set_reviewed(self, item_index: int, reviewed: bool) -> None:
+        value = 1 if reviewed else 0
+        if self._reviewed[item_index] == value:
+            return
+        self._reviewed[item_index] = value
+        index = self.index_for_item(item_index, 1)
+        self.dataChanged.emit(index, index, [REVIEWED_ROLE])
+
+    def shutdown(self) -> None:
+        # Drops queued loads and waits for the running ones, so no worker emits
+        # into a model that is being destroyed.
+        self._loaded_timer.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _request_reviewed(self, item_index: int) -> None:
+        if item_index in self._pending:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="captioncheck-reviewed",
+            )
+        self._pending.add(item_index)
+        self._executor.submit(self._load_in_worker, item_index)
+
+    def _load_in_worker(self, item_index: int) -> None:
+        try:
+            reviewed = self._load_reviewed(self._items[item_index])
+        except Exception:  # noqa: BLE001
+            reviewed = False
+        self._reviewed_loaded.emit(item_index, reviewed)
+
+    def _on_reviewed_loaded(self, item_index: int, reviewed: bool) -> None:
+        self._loaded.append((item_index, reviewed))
+        if not self._loaded_timer.isActive():
+            self._loaded_timer.start()
+
+    def _apply_loaded(self) -> None:
+        loaded, self._loaded = self._loaded, []
+        changed: list[int] = []
+        for item_index, reviewed in loaded:
+            self._pending.discard(item_index)
+            # A flag set meanwhile (e.g. the user toggled it) is newer than the read.
+            if self._reviewed[item_index] != _UNKNOWN:
+                continue
+            self._reviewed[item_index] = 1 if reviewed else 0
+            changed.append(item_index)
+        if not changed:
+            return
+
+        # dataChanged ranges must share a parent, so runs also break at sport
+        # boundaries.
+        changed.sort()
+        first = last = changed[0]
+        sport_end = self._sport_end(first)
+        for item_index in changed[1:]:
+            if item_index == last + 1 and item_index < sport_end:
+                last = item_index
+                continue
+            self._emit_reviewed_changed(first, last)
+            first = last = item_index
+            sport_end = self._sport_end(first)
+        self._emit_reviewed_changed(first, last)
+
+    def _sport_end(self, item_index: int) -> int:
+        sport_row = bisect_right(self._sport_starts, item_index) - 1
+        return self._sport_starts[sport_row] + self._sport_sizes[sport_row]
+
+    def _emit_reviewed_changed(self, first: int, last: int) -> None:
+        self.dataChanged.emit(
+            self.index_for_item(first, 1), self.index_for_item(last, 1), [REVIEWED_ROLE]
+        )
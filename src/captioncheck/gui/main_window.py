@@ -1,16 +1,39 @@
 from __future__ import annotations
 
+import os
 import shutil
+import threading
 import time
-from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QEvent, QProcess, QTimer, Qt
-from PySide6.QtGui import QFont, QKeyEvent, QPixmap
+from PySide6.QtCore import (
+    QEvent,
+    QObject,
+    QProcess,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import (
+    QFont,
+    QGuiApplication,
+    QImage,
+    QImageReader,
+    QKeyEvent,
+    QKeySequence,
+    QPixmap,
+    QPixmapCache,
+    QShortcut,
+)
 from PySide6.QtWidgets import (
-    QApplication,
     QCheckBox,
     QComboBox,
     QHBoxLayout,
@@ -23,44 +46,301 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QSplitter,
     QSlider,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
+try:
+    from turbojpeg import TJPF_BGRX, TurboJPEG
+except ImportError:  # pragma: no cover - optional speedup
+    TurboJPEG = None  # type: ignore[assignment,misc]
+
+from ..caption_header import read_caption_info
 from ..config import AppConfig
-from ..dataset import DatasetItem, iter_dataset_items
+from ..dataset import DatasetItem, flatten_items, scan_dataset
 from ..external_editor import open_path_in_editor
+from ..ffmpeg_hwaccel import detect_hwaccel
+from ..index_cache import load_index, save_index
+from ..json_cache import invalidate as invalidate_json_cache
+from ..json_cache import read_json_cached, read_reviewed_flag, seed_reviewed_flag
 from ..json_io import read_json, write_json_atomic
+from ..reviewed_flag import patch_reviewed_tail
+from .dataset_model import DatasetTreeModel
+from .reviewed_delegate import ReviewedDelegate
+
+
+_SPEED_RATES: tuple[tuple[str, float], ...] = tuple(
+    (f"{rate:g}x", rate) for rate in (0.25, 0.5, 1.0, 1.5, 2.0, 4.0, 8.0)
+)
+_DEFAULT_SPEED_INDEX = 2
+
+_KEY_SPACE = QKeySequence(Qt.Key.Key_Space)
+_KEY_UP = QKeySequence(Qt.Key.Key_Up)
+_KEY_DOWN = QKeySequence(Qt.Key.Key_Down)
+_KEY_LEFT = QKeySequence(Qt.Key.Key_Left)
+_KEY_RIGHT = QKeySequence(Qt.Key.Key_Right)
+
+
+@contextmanager
+def qt_blocked(obj: QObject) -> Iterator[None]:
+    old = obj.blockSignals(True)
+    try:
+        yield
+    finally:
+        obj.blockSignals(old)
+
+
+_turbojpeg: Any = None
+if TurboJPEG is not None:
+    try:
+        _turbojpeg = TurboJPEG()
+    except Exception:  # noqa: BLE001 - the shared library may be missing
+        _turbojpeg = None
+
+
+def _scan_frames(frames_dir: Path) -> tuple[int, int]:
+    # (count, highest index) of the %06d.jpg frames, from one directory pass.
+    count = 0
+    last_index = -1
+    with os.scandir(frames_dir) as it:
+        for entry in it:
+            name = entry.name
+            if len(name) != 10 or not name.endswith(".jpg"):
+                continue
+            try:
+                index = int(name[:6])
+            except ValueError:
+                continue
+            count += 1
+            if index > last_index:
+                last_index = index
+    return count, last_index
 
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+@dataclass
+class _FrameJob:
+    process: QProcess
+    item: DatasetItem
+    tmp_dir: Path
+    final_dir: Path
+    expected_total_frames: int | None
+    expected_fps: float | None
+    max_size: tuple[int, int] | None = None
+    serial: int = 0
+    stdout_buffer: bytearray = field(default_factory=bytearray)
+    poster_shown: bool = False
+
+
+class _FrameJobError(Exception):
+    def __init__(self, status: str, view_text: str, *, detail: str = "") -> None:
+        super().__init__(status)
+        self.status = status
+        self.view_text = view_text
+        self.detail = detail
+
+
+def _write_reviewed(item: DatasetItem, reviewed: bool) -> None:
+    try:
+        # Flipping the flag in place avoids re-serialising the whole file.
+        if not patch_reviewed_tail(item.long_caption_path, reviewed):
+            long_caption = dict(read_json_cached(item.long_caption_path))
+            # Re-appended so the key ends up last and the next toggle can be
+            # patched in place.
+            long_caption.pop("reviewed", None)
+            long_caption["reviewed"] = reviewed
+            write_json_atomic(item.long_caption_path, long_caption)
+    finally:
+        invalidate_json_cache(item.long_caption_path)
+    # An in-place patch keeps the size, and two toggles within one mtime tick
+    # keep the mtime too, so the cached flag is re-stamped with the value just
+    # written rather than left to be re-derived from an unchanged stamp.
+    try:
+        st = os.stat(item.long_caption_path)
+    except OSError:
+        return
+    seed_reviewed_flag(item.long_caption_path, st.st_mtime_ns, st.st_size, reviewed)
+
+
+def _save_index_quietly(data_root: Path, items: list[DatasetItem]) -> None:
+    try:
+        save_index(data_root, items)
+    except Exception:  # noqa: BLE001 - the index is only a cache
+        pass
+
+
+def _fits_view(frame_w: int, frame_h: int, target_size: QSize) -> QSize | None:
+    # The size a frame larger than the view is scaled down to, or None when it
+    # already fits (or the view has no size yet).
+    target_w, target_h = target_size.width(), target_size.height()
+    if target_w <= 0 or target_h <= 0 or (frame_w <= target_w and frame_h <= target_h):
+        return None
+    return QSize(frame_w, frame_h).scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+
+
+def _read_frame_image_turbo(path: str, target_size: QSize) -> QImage | None:
+    # libjpeg-turbo decode, reduced by the smallest DCT scaling factor that
+    # still covers the fitted size. None means "use QImageReader instead".
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        width, height, _, _ = _turbojpeg.decode_header(data)  # type: ignore[union-attr]
+        scaling_factor = None
+        fitted = _fits_view(width, height, target_size)
+        if fitted is not None:
+            best = None
+            for num, denom in _turbojpeg.scaling_factors:  # type: ignore[union-attr]
+                if num >= denom:
+                    continue
+                scaled_w = -(-width * num // denom)
+                scaled_h = -(-height * num // denom)
+                if scaled_w < fitted.width() or scaled_h < fitted.height():
+                    continue
+                if best is None or num * best[1] < best[0] * denom:
+                    best = (num, denom)
+            scaling_factor = best
+        pixels = _turbojpeg.decode(  # type: ignore[union-attr]
+            data, pixel_format=TJPF_BGRX, scaling_factor=scaling_factor
+        )
+    except Exception:  # noqa: BLE001
+        return None
+    h, w = pixels.shape[:2]
+    # BGRX bytes are Format_RGB32 on little-endian machines; copy() detaches
+    # the image from the decoder's buffer.
+    image = QImage(pixels.data, w, h, pixels.strides[0], QImage.Format.Format_RGB32)
+    if fitted is not None and (w, h) != (fitted.width(), fitted.height()):
+        # DCT scaling stops at the nearest factor above the view size; finish
+        # here so the cached pixmap is shown without scaling on every display.
+        return image.scaled(
+            fitted,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+    return image.copy()
+
+
+def _read_frame_image(path: str, target_size: QSize) -> QImage:
+    # Frames larger than the view are decoded straight to the fitted size; the
+    # JPEG decoder then scales in the DCT domain instead of producing a
+    # full-size image that is immediately scaled down again. QImage (unlike
+    # QPixmap) may be created off the GUI thread.
+    if _turbojpeg is not None:
+        image = _read_frame_image_turbo(path, target_size)
+        if image is not None:
+            return image
+    reader = QImageReader(path)
+    frame_size = reader.size()
+    if frame_size.isValid():
+        fitted = _fits_view(frame_size.width(), frame_size.height(), target_size)
+        if fitted is not None:
+            reader.setScaledSize(fitted)
+    return reader.read()
+
+
+class _FrameLoadSignals(QObject):
+    # (QPixmapCache key, decoded image; null on failure)
+    loaded = Signal(str, QImage)
+
+
+class _FrameLoadTask(QRunnable):
+    def __init__(
+        self, path: str, key: str, target_size: QSize, signals: _FrameLoadSignals
+    ) -> None:
+        super().__init__()
+        self._path = path
+        self._key = key
+        self._target_size = QSize(target_size)
+        self._signals = signals
+
+    def run(self) -> None:
+        self._signals.loaded.emit(self._key, _read_frame_image(self._path, self._target_size))
+
+
+class _HwaccelProbeSignals(QObject):
+    # Detected hwaccel name, or "" for software decoding.
+    finished = Signal(str)
+
+
+class _HwaccelProbeTask(QRunnable):
+    def __init__(self, ffmpeg_path: str, requested: str, signals: _HwaccelProbeSignals) -> None:
+        super().__init__()
+        self._ffmpeg_path = ffmpeg_path
+        self._requested = requested
+        self._signals = signals
+
+    def run(self) -> None:
+        self._signals.finished.emit(detect_hwaccel(self._ffmpeg_path, self._requested) or "")
+
+
+class _ReviewedWriteSignals(QObject):
+    # (resolved_dir_str, reviewed, error message or "" on success)
+    finished = Signal(str, bool, str)
+
+
+class _ReviewedWriteTask(QRunnable):
+    def __init__(self, item: DatasetItem, reviewed: bool, signals: _ReviewedWriteSignals) -> None:
+        super().__init__()
+        self._item = item
+        self._reviewed = reviewed
+        self._signals = signals
+
+    def run(self) -> None:
+        error = ""
+        try:
+            _write_reviewed(self._item, self._reviewed)
+        except Exception as e:  # noqa: BLE001
+            error = str(e) or type(e).__name__
+        self._signals.finished.emit(self._item.resolved_dir_str, self._reviewed, error)
+
+
+class _RemoveTreeTask(QRunnable):
+    def __init__(self, paths: list[Path]) -> None:
+        super().__init__()
+        self._paths = paths
+
+    def run(self) -> None:
+        for path in self._paths:
+            shutil.rmtree(path, ignore_errors=True)
+
+
 class MainWindow(QMainWindow):
-    _PIXMAP_CACHE_SIZE = 128
+    _PIXMAP_CACHE_LIMIT_KB = 256 * 1024
+    _PREFETCH_FRAMES = 8
 
     def __init__(self, config: AppConfig) -> None:
         super().__init__()
         self._config = config
-        self._items = iter_dataset_items(config.data_root)
-        self._item_by_dir: dict[Path, DatasetItem] = {
-            item.dir_path.resolve(): item for item in self._items
+        items_by_sport = load_index(config.data_root)
+        if items_by_sport is None:
+            items_by_sport = scan_dataset(config.data_root)
+        self._items_by_sport = items_by_sport
+        self._items = flatten_items(items_by_sport)
+        self._item_index_by_dir: dict[str, int] = {
+            item.resolved_dir_str: i for i, item in enumerate(self._items)
         }
-        self._event_node_by_dir: dict[Path, QTreeWidgetItem] = {}
-        self._review_indicator_by_dir: dict[Path, QCheckBox] = {}
 
         self._current_item: DatasetItem | None = None
+        # resolved_dir_str of the loaded item: events may share one video
+        # through symlinks, so the event directory is the item's identity.
+        self._current_dir = ""
         self._fps = 10.0
         self._total_frames = 0
+        self._max_frame = 0
         self._current_frame = 0
-        self._suppress_seek = False
+        self._frame_info_suffix = ""
+        self._last_frame_shown = -1
+        self._frame_info_text = "- / -"
         self._slider_dragging = False
 
         self._playing = False
+        # Precise timers: the default coarse type may fire up to 5% of the
+        # interval early or late, which shows up as uneven frame pacing.
         self._play_timer = QTimer(self)
+        self._play_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._play_timer.setInterval(15)
         self._play_timer.timeout.connect(self._on_play_tick)
         self._play_last_time = 0.0
@@ -69,36 +349,99 @@ class MainWindow(QMainWindow):
         self._step_hold_left = False
         self._step_hold_right = False
         self._step_timer = QTimer(self)
+        self._step_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._step_timer.setInterval(15)
         self._step_timer.timeout.connect(self._on_step_hold_tick)
         self._step_last_time = 0.0
         self._step_frame_accum = 0.0
 
+        # Slider/label updates are coalesced to at most one per ~60 Hz frame.
+        # The picture is swapped once per event-loop turn: several frame
+        # changes queued in one turn (fast playback, scrubbing) cost a single
+        # decode of the latest frame.
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setSingleShot(True)
+        self._ui_timer.setInterval(16)
+        self._ui_timer.timeout.connect(self._flush_position_ui)
+        self._pending_ui_frame = 0
+        self._display_timer = QTimer(self)
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(0)
+        self._display_timer.timeout.connect(self._flush_display_frame)
+        # Slider drags arrive at mouse rate; seek (and decode) at most once
+        # per ~16 ms while the label follows the handle immediately.
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(16)
+        self._seek_timer.timeout.connect(self._flush_pending_seek)
+        self._seek_pending: int | None = None
+
+        # Reviewed toggles are written behind: the UI updates at once and the
+        # latest value per item is written to disk on the next flush, by a
+        # worker thread. An item keeps at most one write in flight so writes
+        # land in order; _writing_reviewed holds the values not yet on disk.
+        self._pending_reviewed: dict[str, tuple[DatasetItem, bool]] = {}
+        self._writing_reviewed: dict[str, bool] = {}
+        self._reviewed_flush_timer = QTimer(self)
+        self._reviewed_flush_timer.setSingleShot(True)
+        self._reviewed_flush_timer.setInterval(200)
+        self._reviewed_flush_timer.timeout.connect(self._flush_reviewed_writes)
+        self._write_pool = QThreadPool(self)
+        self._write_signals = _ReviewedWriteSignals(self)
+        self._write_signals.finished.connect(self._on_reviewed_write_finished)
+
         self._frames_dir: Path | None = None
-        self._pixmap_cache: OrderedDict[int, QPixmap] = OrderedDict()
+        # Decoded frames live in the process-wide QPixmapCache under
+        # "<frames dir>@<meta.json mtime>/<view size>/" + frame, so they survive
+        # switching items and a regenerated or resized cache never matches.
+        QPixmapCache.setCacheLimit(self._PIXMAP_CACHE_LIMIT_KB)
+        self._frames_dir_str = ""
+        self._frames_stamp = ""
+        self._frame_key_prefix = ""
+        self._prefetching: set[str] = set()
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(2)
+        self._prefetch_signals = _FrameLoadSignals(self)
+        self._prefetch_signals.loaded.connect(self._on_frame_prefetched)
         self._current_base_pixmap: QPixmap | None = None
 
         self._ffmpeg_path = shutil.which("ffmpeg")
-        self._gen_process: QProcess | None = None
-        self._gen_stdout_buffer = ""
-        self._gen_tmp_dir: Path | None = None
-        self._gen_final_dir: Path | None = None
-        self._gen_expected_total_frames: int | None = None
-        self._gen_expected_fps: float | None = None
+        # Extraction decodes in software until the `ffmpeg -hwaccels` probe,
+        # run off the GUI thread, reports a usable method.
+        self._hwaccel: str | None = None
+        requested_hwaccel = config.ffmpeg_hwaccel
+        if requested_hwaccel and self._ffmpeg_path is not None:
+            # No parent: the task may outlive the window and still emit.
+            self._hwaccel_signals = _HwaccelProbeSignals()
+            self._hwaccel_signals.finished.connect(self._on_hwaccel_probed)
+            QThreadPool.globalInstance().start(
+                _HwaccelProbeTask(self._ffmpeg_path, requested_hwaccel, self._hwaccel_signals)
+            )
+        self._gen_job: _FrameJob | None = None
+        self._frame_job_serial = 0
+        self._preload_job: _FrameJob | None = None
 
         self.setWindowTitle("CaptionCheck")
         self.resize(1200, 800)
 
-        self._tree = QTreeWidget()
-        self._tree.setHeaderLabels(["Sport/Event", "Reviewed"])
+        self._tree_model = DatasetTreeModel(
+            self._items_by_sport,
+            lambda item: read_reviewed_flag(item.long_caption_path),
+            self,
+        )
+        self._tree = QTreeView()
+        self._tree.setModel(self._tree_model)
+        self._tree.setUniformRowHeights(True)
         header = self._tree.header()
         header.setStretchLastSection(False)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
         self._tree.setColumnWidth(1, 68)
+        self._tree.setItemDelegateForColumn(1, ReviewedDelegate(self._tree))
+        self._tree_model.reviewed_toggled.connect(self._on_tree_reviewed_toggled)
         self._tree.setMinimumSize(0, 0)
-        self._tree.itemSelectionChanged.connect(self._on_tree_selection_changed)
-        self._populate_tree()
+        self._tree.selectionModel().selectionChanged.connect(self._on_tree_selection_changed)
+        self._tree.expandAll()
 
         self._frame_view = QLabel("Select a video")
         self._frame_view.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -112,9 +455,10 @@ class MainWindow(QMainWindow):
         self._play_button.clicked.connect(self._toggle_play)
 
         self._speed_combo = QComboBox()
-        for rate in [0.25, 0.5, 1.0, 1.5, 2.0, 4.0, 8.0]:
-            self._speed_combo.addItem(f"{rate:g}x", rate)
-        self._speed_combo.setCurrentIndex(2)
+        for label, rate in _SPEED_RATES:
+            self._speed_combo.addItem(label, rate)
+        self._speed_combo.setCurrentIndex(_DEFAULT_SPEED_INDEX)
+        self._play_rate = _SPEED_RATES[_DEFAULT_SPEED_INDEX][1]
         self._speed_combo.currentIndexChanged.connect(self._on_speed_changed)
 
         self._frame_slider = QSlider(Qt.Orientation.Horizontal)
@@ -179,161 +523,145 @@ class MainWindow(QMainWindow):
         self.statusBar().addWidget(self._status_text, 1)
         self.statusBar().addPermanentWidget(self._status_progress)
 
-        app = QApplication.instance()
-        if app is not None:
-            app.installEventFilter(self)
+        # Window-scoped shortcuts take precedence over the focused widget's own
+        # arrow/space handling (tree navigation, slider steps, button press).
+        # Auto-repeat is disabled; holding an arrow is timed by _step_timer
+        # until keyReleaseEvent sees the key go up.
+        for key, slot in (
+            (_KEY_SPACE, self._toggle_play),
+            (_KEY_UP, self._speed_up),
+            (_KEY_DOWN, self._speed_down),
+            (_KEY_LEFT, self._step_back),
+            (_KEY_RIGHT, self._step_forward),
+        ):
+            shortcut = QShortcut(key, self)
+            shortcut.setContext(Qt.ShortcutContext.WindowShortcut)
+            shortcut.setAutoRepeat(False)
+            shortcut.activated.connect(slot)
 
         if self._items:
             self._select_first_item()
 
     def closeEvent(self, event: object) -> None:  # noqa: N802
         self._cancel_frame_generation()
+        self._cancel_preload()
         self._set_playing(False)
         self._step_timer.stop()
+        self._tree_model.shutdown()
+        self._prefetch_pool.clear()
+        self._prefetch_pool.waitForDone()
+        self._reviewed_flush_timer.stop()
+        self._write_pool.waitForDone()
+        self._flush_reviewed_writes_now()
+        # Saving the index stats every sport and event directory. A plain
+        # (non-daemon) thread lets the window close at once while the
+        # interpreter still waits for the write before exiting.
+        threading.Thread(
+            target=_save_index_quietly,
+            args=(self._config.data_root, list(self._items)),
+            name="captioncheck-save-index",
+        ).start()
         super().closeEvent(event)  # type: ignore[misc]
 
     def eventFilter(self, watched: object, event: object) -> bool:  # noqa: N802
         if watched is self._frame_view and isinstance(event, QEvent):
-            if event.type() == QEvent.Type.Resize and self._current_base_pixmap is not None:
-                self._set_frame_view_pixmap(self._current_base_pixmap)
-        if isinstance(event, QKeyEvent):
-            if not self.isActiveWindow():
-                return super().eventFilter(watched, event)
-
-            if event.type() == QEvent.Type.KeyPress:
-                if event.key() == Qt.Key.Key_Space:
-                    if not event.isAutoRepeat():
-                        self._toggle_play()
-                    return True
-                if event.key() == Qt.Key.Key_Up:
-                    if not event.isAutoRepeat():
-                        self._step_speed(1)
-                    return True
-                if event.key() == Qt.Key.Key_Down:
-                    if not event.isAutoRepeat():
-                        self._step_speed(-1)
-                    return True
-                if event.key() == Qt.Key.Key_Left:
-                    if not event.isAutoRepeat():
-                        self._step_hold_left = True
-                        self._start_step_hold()
-                    return True
-                if event.key() == Qt.Key.Key_Right:
-                    if not event.isAutoRepeat():
-                        self._step_hold_right = True
-                        self._start_step_hold()
-                    return True
-
-            if event.type() == QEvent.Type.KeyRelease:
-                if event.key() == Qt.Key.Key_Left:
-                    if not event.isAutoRepeat():
-                        self._step_hold_left = False
-                        self._maybe_stop_step_hold()
-                    return True
-                if event.key() == Qt.Key.Key_Right:
-                    if not event.isAutoRepeat():
-                        self._step_hold_right = False
-                        self._maybe_stop_step_hold()
-                    return True
+            if event.type() == QEvent.Type.Resize:
+                self._on_frame_view_resized()
         return False
 
-    def _populate_tree(self) -> None:
-        sport_nodes: dict[str, QTreeWidgetItem] = {}
-        self._event_node_by_dir = {}
-        self._review_indicator_by_dir = {}
-        for item in self._items:
-            sport_node = sport_nodes.get(item.sport)
-            if sport_node is None:
-                sport_node = QTreeWidgetItem([item.sport, ""])
-                sport_nodes[item.sport] = sport_node
-                self._tree.addTopLevelItem(sport_node)
-
-            event_node = QTreeWidgetItem([item.event, ""])
-            event_node.setData(0, Qt.ItemDataRole.UserRole, str(item.dir_path.resolve()))
-            reviewed = False
-            try:
-                long_caption = read_json(item.long_caption_path)
-                reviewed = bool(long_caption.get("reviewed", False))
-            except Exception:
-                reviewed = False
-            reviewed_indicator = QCheckBox()
-            reviewed_indicator.setChecked(reviewed)
-            reviewed_indicator.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            reviewed_indicator.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-            reviewed_indicator.setTristate(False)
-
-            sport_node.addChild(event_node)
-
-            indicator_container = QWidget()
-            indicator_container.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            indicator_container.setAttribute(
-                Qt.WidgetAttribute.WA_TransparentForMouseEvents, True
-            )
-            indicator_layout = QHBoxLayout(indicator_container)
-            indicator_layout.setContentsMargins(0, 0, 0, 0)
-            indicator_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            indicator_layout.addWidget(reviewed_indicator)
-            self._tree.setItemWidget(event_node, 1, indicator_container)
-            self._event_node_by_dir[item.dir_path.resolve()] = event_node
-            self._review_indicator_by_dir[item.dir_path.resolve()] = reviewed_indicator
+    def _on_frame_view_resized(self) -> None:
+        self._update_frame_key_prefix()
+        if self._frames_ready():
+            # Cached frames were decoded for the old size.
+            self._display_frame(self._current_frame)
+        elif self._current_base_pixmap is not None:
+            self._set_frame_view_pixmap(self._current_base_pixmap)
+
+    def keyReleaseEvent(self, event: QKeyEvent) -> None:  # noqa: N802
+        if event.key() in (Qt.Key.Key_Left, Qt.Key.Key_Right):
+            if not event.isAutoRepeat():
+                if event.key() == Qt.Key.Key_Left:
+                    self._step_hold_left = False
+                else:
+                    self._step_hold_right = False
+                self._maybe_stop_step_hold()
+            event.accept()
+            return
+        super().keyReleaseEvent(event)
+
+    def changeEvent(self, event: QEvent) -> None:  # noqa: N802
+        # Key releases are not delivered once the window loses focus.
+        if event.type() == QEvent.Type.ActivationChange and not self.isActiveWindow():
+            self._step_hold_left = False
+            self._step_hold_right = False
+            self._step_timer.stop()
+        super().changeEvent(event)
 
-        for sport_node in sport_nodes.values():
-            sport_node.setExpanded(True)
+    def _step_back(self) -> None:
+        self._step_hold_left = True
+        self._start_step_hold()
+
+    def _step_forward(self) -> None:
+        self._step_hold_right = True
+        self._start_step_hold()
+
+    def _speed_up(self) -> None:
+        self._step_speed(1)
+
+    def _speed_down(self) -> None:
+        self._step_speed(-1)
 
     def _select_first_item(self) -> None:
-        top = self._tree.topLevelItem(0)
-        if top is None or top.childCount() == 0:
-            return
-        self._tree.setCurrentItem(top.child(0))
+        self._tree.setCurrentIndex(self._tree_model.index_for_item(0))
 
     def _on_tree_selection_changed(self) -> None:
-        node = self._tree.currentItem()
-        if node is None or node.parent() is None:
-            return
-        dir_str = node.data(0, Qt.ItemDataRole.UserRole)
-        if not dir_str:
-            return
-        item = self._item_by_dir.get(Path(str(dir_str)))
+        item = self._tree_model.item(self._tree.currentIndex())
         if item is None:
             return
         self._load_item(item)
 
     def _load_item(self, item: DatasetItem) -> None:
-        if self._current_item and self._current_item.dir_path.resolve() == item.dir_path.resolve():
+        if item.resolved_dir_str == self._current_dir:
             return
 
         self._set_playing(False)
         self._step_timer.stop()
+        self._ui_timer.stop()
+        self._display_timer.stop()
+        self._seek_timer.stop()
+        self._seek_pending = None
         self._step_hold_left = False
         self._step_hold_right = False
         self._cancel_frame_generation()
 
         self._current_item = item
-        self._pixmap_cache.clear()
-        self._frames_dir = None
+        self._set_frames_dir(None)
         self._current_frame = 0
 
-        long_caption = read_json(item.long_caption_path)
-        info = long_caption.get("info") or {}
+        # Only the header and the reviewed flag are needed here; neither read
+        # parses the spans unless the file is laid out unusually.
+        info = read_caption_info(item.long_caption_path)
+        if info is None:
+            info = read_json_cached(item.long_caption_path).get("info") or {}
         self._fps = float(info.get("fps") or 10.0)
-        self._total_frames = int(info.get("total_frames") or 0)
+        self._set_total_frames(int(info.get("total_frames") or 0))
 
-        reviewed = bool(long_caption.get("reviewed", False))
-        self._reviewed_checkbox.blockSignals(True)
-        self._reviewed_checkbox.setChecked(reviewed)
-        self._reviewed_checkbox.blockSignals(False)
-        self._set_tree_reviewed_state(item.dir_path.resolve(), reviewed)
-
-        if self._total_frames > 0:
-            self._frame_slider.setRange(0, max(0, self._total_frames - 1))
+        pending = self._pending_reviewed.get(item.resolved_dir_str)
+        if pending is not None:
+            reviewed = pending[1]
+        elif item.resolved_dir_str in self._writing_reviewed:
+            reviewed = self._writing_reviewed[item.resolved_dir_str]
         else:
-            self._frame_slider.setRange(0, 0)
+            reviewed = read_reviewed_flag(item.long_caption_path)
+        self._set_reviewed_checkbox(reviewed)
+        self._set_tree_reviewed_state(item.resolved_dir_str, reviewed)
+
+        self._frame_slider.setRange(0, self._max_frame)
 
-        self._suppress_seek = True
         self._frame_slider.setValue(0)
-        self._suppress_seek = False
         self._update_frame_info(0)
 
+        self._current_dir = item.resolved_dir_str
         self._ensure_frames_for_current_item()
 
     def _toggle_play(self) -> None:
@@ -353,17 +681,20 @@ class MainWindow(QMainWindow):
             self._playing = True
             self._play_last_time = time.monotonic()
             self._play_frame_accum = 0.0
-            self._play_timer.start()
+            self._play_timer.start(self._tick_interval_ms())
             return
 
         self._play_timer.stop()
         self._playing = False
         self._play_button.setText("Play")
 
-    def _on_speed_changed(self) -> None:
-        if self._playing:
-            # The timer tick reads the current combo value.
-            pass
+    def _on_speed_changed(self, index: int) -> None:
+        # Cache the rate so the timer ticks don't query the combo box; the
+        # timers' cadence follows it.
+        self._play_rate = _SPEED_RATES[index][1] if 0 <= index < len(_SPEED_RATES) else 1.0
+        interval = self._tick_interval_ms()
+        self._play_timer.setInterval(interval)
+        self._step_timer.setInterval(interval)
 
     def _on_slider_pressed(self) -> None:
         self._slider_dragging = True
@@ -372,6 +703,8 @@ class MainWindow(QMainWindow):
 
     def _on_slider_released(self) -> None:
         self._slider_dragging = False
+        self._seek_timer.stop()
+        self._seek_pending = None
         if not self._frames_ready():
             return
         self._set_current_frame(self._frame_slider.value())
@@ -379,64 +712,136 @@ class MainWindow(QMainWindow):
     def _on_slider_moved(self, frame: int) -> None:
         if not self._frames_ready():
             return
-        self._set_current_frame(frame)
+        self._update_frame_info(frame)
+        self._seek_pending = frame
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+
+    def _flush_pending_seek(self) -> None:
+        frame = self._seek_pending
+        self._seek_pending = None
+        if frame is not None:
+            self._set_current_frame(frame)
 
     def _set_current_frame(self, frame: int) -> None:
         if not self._frames_ready():
             return
-        frame = max(0, int(frame))
-        if self._total_frames:
-            frame = min(frame, self._total_frames - 1)
+        frame = int(frame)
+        frame = 0 if frame < 0 else (self._max_frame if frame > self._max_frame else frame)
         if frame == self._current_frame:
             return
         self._current_frame = frame
+        self._pending_ui_frame = frame
+        if not self._ui_timer.isActive():
+            self._ui_timer.start()
+        if not self._display_timer.isActive():
+            self._display_timer.start()
+
+    def _flush_display_frame(self) -> None:
+        if self._frames_ready():
+            self._display_frame(self._current_frame)
+
+    def _flush_position_ui(self) -> None:
+        frame = self._pending_ui_frame
         if not self._slider_dragging:
-            self._suppress_seek = True
             self._frame_slider.setValue(frame)
-            self._suppress_seek = False
         self._update_frame_info(frame)
-        self._display_frame(frame)
+
+    def _set_frames_dir(self, frames_dir: Path | None, stamp: str | None = None) -> None:
+        # `stamp` distinguishes directories without a meta.json yet (frames of
+        # a running job); finished caches are told apart by meta.json's mtime.
+        if frames_dir != self._frames_dir:
+            self._prefetch_pool.clear()
+            self._prefetching.clear()
+        self._frames_dir = frames_dir
+        self._frames_dir_str = "" if frames_dir is None else f"{frames_dir}{os.sep}"
+        self._frames_stamp = ""
+        if frames_dir is not None:
+            if stamp is None:
+                try:
+                    stamp = str(self._frames_meta_path(frames_dir).stat().st_mtime_ns)
+                except OSError:
+                    stamp = "0"
+            self._frames_stamp = f"{frames_dir}@{stamp}/"
+        self._update_frame_key_prefix()
+
+    def _update_frame_key_prefix(self) -> None:
+        size = self._frame_view.contentsRect().size()
+        self._frame_key_prefix = f"{self._frames_stamp}{size.width()}x{size.height()}/"
 
     def _display_frame(self, frame: int) -> None:
-        frames_dir = self._frames_dir
-        if frames_dir is None:
+        if self._frames_dir is None:
             self._current_base_pixmap = None
             return
-        pixmap = self._pixmap_cache.get(frame)
-        if pixmap is not None and not pixmap.isNull():
-            self._pixmap_cache.move_to_end(frame)
+        key = f"{self._frame_key_prefix}{frame}"
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap) and not pixmap.isNull():
             self._current_base_pixmap = pixmap
             self._frame_view.setText("")
             self._set_frame_view_pixmap(pixmap)
             return
 
-        frame_path = frames_dir / f"{frame:06d}.jpg"
-        if not frame_path.exists():
-            self._current_base_pixmap = None
-            self._frame_view.setPixmap(QPixmap())
-            self._frame_view.setText(f"Missing frame {frame}")
-            return
-
-        pixmap = QPixmap(str(frame_path))
+        # No exists() check up front: opening the file is the check, and the
+        # failure path alone pays for telling missing from unreadable.
+        frame_path = f"{self._frames_dir_str}{frame:06d}.jpg"
+        pixmap = self._read_frame_pixmap(frame_path)
         if pixmap.isNull():
             self._current_base_pixmap = None
             self._frame_view.setPixmap(QPixmap())
-            self._frame_view.setText(f"Failed to load frame {frame}")
+            if os.path.exists(frame_path):
+                self._frame_view.setText(f"Failed to load frame {frame}")
+            else:
+                self._frame_view.setText(f"Missing frame {frame}")
             return
 
-        self._pixmap_cache[frame] = pixmap
-        self._pixmap_cache.move_to_end(frame)
-        while len(self._pixmap_cache) > self._PIXMAP_CACHE_SIZE:
-            self._pixmap_cache.popitem(last=False)
+        QPixmapCache.insert(key, pixmap)
         self._current_base_pixmap = pixmap
         self._frame_view.setText("")
         self._set_frame_view_pixmap(pixmap)
 
+    def _read_frame_pixmap(self, path: str) -> QPixmap:
+        image = _read_frame_image(path, self._frame_view.contentsRect().size())
+        if image.isNull():
+            return QPixmap()
+        return QPixmap.fromImage(image)
+
+    def _prefetch_frames(self, stride: int) -> None:
+        # Decodes the next frames along the playback direction on worker
+        # threads, so the tick that needs them finds them in QPixmapCache.
+        frames_dir = self._frames_dir
+        if frames_dir is None or stride == 0:
+            return
+        target_size = self._frame_view.contentsRect().size()
+        probe = QPixmap()
+        frame = self._current_frame
+        for _ in range(self._PREFETCH_FRAMES):
+            frame += stride
+            if frame < 0 or frame > self._max_frame:
+                break
+            key = f"{self._frame_key_prefix}{frame}"
+            if key in self._prefetching or QPixmapCache.find(key, probe):
+                continue
+            self._prefetching.add(key)
+            path = f"{self._frames_dir_str}{frame:06d}.jpg"
+            self._prefetch_pool.start(
+                _FrameLoadTask(path, key, target_size, self._prefetch_signals)
+            )
+
+    def _on_frame_prefetched(self, key: str, image: QImage) -> None:
+        self._prefetching.discard(key)
+        if not image.isNull():
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
+
     def _set_frame_view_pixmap(self, pixmap: QPixmap) -> None:
         target_size = self._frame_view.contentsRect().size()
         if target_size.width() <= 0 or target_size.height() <= 0:
             self._frame_view.setPixmap(pixmap)
             return
+        size = pixmap.size()
+        if size.scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio) == size:
+            # Frames are decoded (and cached) at the view's fitted size.
+            self._frame_view.setPixmap(pixmap)
+            return
         scaled = pixmap.scaled(
             target_size,
             Qt.AspectRatioMode.KeepAspectRatio,
@@ -452,20 +857,19 @@ class MainWindow(QMainWindow):
         delta = now - self._play_last_time
         self._play_last_time = now
 
-        rate = float(self._speed_combo.currentData() or 1.0)
-        self._play_frame_accum += delta * self._fps * rate
+        self._play_frame_accum += delta * self._fps * self._play_rate
         advance = int(self._play_frame_accum)
         if advance <= 0:
             return
         self._play_frame_accum -= advance
 
         target = self._current_frame + advance
-        if self._total_frames and target >= self._total_frames:
-            target = self._total_frames - 1
-            self._set_current_frame(target)
+        if target > self._max_frame:
+            self._set_current_frame(self._max_frame)
             self._set_playing(False)
             return
         self._set_current_frame(target)
+        self._prefetch_frames(advance)
 
     def _step_speed(self, delta: int) -> None:
         index = self._speed_combo.currentIndex()
@@ -488,9 +892,21 @@ class MainWindow(QMainWindow):
         self._set_playing(False)
         self._step_last_time = time.monotonic()
         self._step_frame_accum = 0.0
-        self._step_timer.start()
+        self._step_timer.start(self._tick_interval_ms())
         self._nudge_frame(direction)
 
+    def _tick_interval_ms(self) -> int:
+        # Tick at no more than half the frame period. A timer period equal to
+        # the (truncated) frame period beats against the frame clock and
+        # periodically holds a frame for two ticks; sampling at twice the rate
+        # keeps every frame within half a period of its due time. The floor
+        # only applies above ~100 displayed frames per second, where the
+        # accumulator advances several frames per tick anyway.
+        rate = self._play_rate
+        if self._fps <= 0 or rate <= 0:
+            return 15
+        return max(5, int(500.0 / (self._fps * rate)))
+
     def _maybe_stop_step_hold(self) -> None:
         if self._step_direction() == 0:
             self._step_timer.stop()
@@ -508,29 +924,41 @@ class MainWindow(QMainWindow):
         delta = now - self._step_last_time
         self._step_last_time = now
 
-        step_rate = float(self._speed_combo.currentData() or 1.0)
-        self._step_frame_accum += delta * self._fps * step_rate
+        self._step_frame_accum += delta * self._fps * self._play_rate
         advance = int(self._step_frame_accum)
         if advance <= 0:
             return
         self._step_frame_accum -= advance
 
         self._nudge_frame(direction * advance)
+        self._prefetch_frames(direction * advance)
 
     def _nudge_frame(self, delta: int) -> None:
         if not self._frames_ready() or self._total_frames <= 0:
             return
         target = self._current_frame + int(delta)
-        target = max(0, min(target, self._total_frames - 1))
+        target = 0 if target < 0 else (self._max_frame if target > self._max_frame else target)
         self._set_current_frame(target)
-        if target in {0, self._total_frames - 1}:
+        if target == 0 or target == self._max_frame:
             self._maybe_stop_step_hold()
 
+    def _set_total_frames(self, total_frames: int) -> None:
+        self._total_frames = total_frames
+        self._max_frame = max(0, total_frames - 1)
+        self._reset_frame_info()
+
+    def _reset_frame_info(self) -> None:
+        self._frame_info_suffix = f" / {self._total_frames - 1}" if self._total_frames else ""
+        self._last_frame_shown = -1
+
     def _update_frame_info(self, frame: int) -> None:
-        if self._total_frames:
-            self._frame_info.setText(f"{frame} / {self._total_frames - 1}")
-        else:
-            self._frame_info.setText("- / -")
+        if frame == self._last_frame_shown:
+            return
+        self._last_frame_shown = frame
+        text = f"{frame:d}{self._frame_info_suffix}" if self._total_frames else "- / -"
+        if text != self._frame_info_text:
+            self._frame_info_text = text
+            self._frame_info.setText(text)
 
     def _frames_ready(self) -> bool:
         return self._frames_dir is not None and self._total_frames > 0
@@ -544,13 +972,12 @@ class MainWindow(QMainWindow):
     def _frames_meta_path(self, frames_dir: Path) -> Path:
         return frames_dir / "meta.json"
 
-    def _frames_cache_valid(self, frames_dir: Path, item: DatasetItem) -> bool:
-        meta_path = self._frames_meta_path(frames_dir)
-        if not meta_path.exists():
-            return False
+    def _frames_cache_valid(
+        self, frames_dir: Path, item: DatasetItem, fps: float, expected_total_frames: int
+    ) -> bool:
         try:
-            meta = read_json(meta_path)
-        except Exception:
+            meta = read_json(self._frames_meta_path(frames_dir))
+        except Exception:  # noqa: BLE001 - missing or unreadable means invalid
             return False
 
         try:
@@ -558,19 +985,35 @@ class MainWindow(QMainWindow):
         except OSError:
             return False
 
-        if int(meta.get("video_mtime_ns") or 0) != int(video_stat.st_mtime_ns):
+        # The cheap identity checks go first, as one tuple comparison; the
+        # frame files are only stat'ed once the metadata matches.
+        if not isinstance(meta, dict):
+            return False
+        get = meta.get
+        try:
+            source = (int(get("video_mtime_ns") or 0), int(get("video_size") or 0))
+            meta_fps = float(get("fps") or 0.0)
+            total_frames = int(get("total_frames") or 0)
+            raw_max_size = get("max_size")
+            meta_max_size = (
+                (int(raw_max_size[0]), int(raw_max_size[1])) if raw_max_size else None
+            )
+        except (TypeError, ValueError, IndexError, KeyError):
             return False
-        if int(meta.get("video_size") or 0) != int(video_stat.st_size):
+        if source != (video_stat.st_mtime_ns, video_stat.st_size):
             return False
-
-        fps = float(meta.get("fps") or 0.0)
-        total_frames = int(meta.get("total_frames") or 0)
-        if fps <= 0 or total_frames <= 0:
+        if meta_fps <= 0 or total_frames <= 0:
             return False
-        if self._fps and abs(fps - self._fps) > 1e-3:
+        if fps and abs(meta_fps - fps) > 1e-3:
             return False
-        if self._total_frames and total_frames != self._total_frames:
+        if expected_total_frames and total_frames != expected_total_frames:
             return False
+        # Frames capped for a smaller screen than the current largest one are
+        # regenerated; caches without a cap hold full-size frames.
+        max_size = self._frame_size_cap()
+        if meta_max_size is not None and max_size is not None:
+            if meta_max_size[0] < max_size[0] or meta_max_size[1] < max_size[1]:
+                return False
 
         first_frame = frames_dir / "000000.jpg"
         last_frame = frames_dir / f"{total_frames - 1:06d}.jpg"
@@ -589,43 +1032,65 @@ class MainWindow(QMainWindow):
             self._frame_view.setText("ffmpeg not found")
             return
 
+        preload = self._preload_job
+        if preload is not None:
+            self._preload_job = None
+            if preload.item.resolved_dir_str == self._current_item.resolved_dir_str:
+                self._adopt_frame_job(preload)
+                return
+            self._kill_frame_job(preload)
+
         frames_dir = self._frames_dir_for_item(self._current_item)
         tmp_dir = frames_dir.with_name(frames_dir.name + ".inprogress")
 
         if tmp_dir.exists():
             shutil.rmtree(tmp_dir, ignore_errors=True)
 
-        if self._frames_cache_valid(frames_dir, self._current_item):
-            self._frames_dir = frames_dir
+        if self._frames_cache_valid(frames_dir, self._current_item, self._fps, self._total_frames):
+            self._set_frames_dir(frames_dir)
             self._set_controls_enabled(True)
             self._set_generation_status("Frames ready (cached).", active=False)
             self._display_frame(0)
+            self._preload_next_item()
             return
 
         if frames_dir.exists():
             shutil.rmtree(frames_dir, ignore_errors=True)
 
-        self._start_frame_generation(
-            video_path=self._current_item.video_path,
-            fps=self._fps,
-            total_frames=self._total_frames,
-            tmp_dir=tmp_dir,
-            final_dir=frames_dir,
+        self._cancel_frame_generation()
+        self._adopt_frame_job(
+            self._spawn_frame_job(
+                self._current_item,
+                fps=self._fps,
+                total_frames=self._total_frames,
+                tmp_dir=tmp_dir,
+                final_dir=frames_dir,
+            )
         )
 
-    def _start_frame_generation(
+    def _frame_size_cap(self) -> tuple[int, int] | None:
+        # Largest device-pixel screen size; the frame view cannot show more.
+        width = height = 0
+        for screen in QGuiApplication.screens():
+            size = screen.size() * screen.devicePixelRatio()
+            width = max(width, size.width())
+            height = max(height, size.height())
+        if width <= 0 or height <= 0:
+            return None
+        return width, height
+
+    def _on_hwaccel_probed(self, hwaccel: str) -> None:
+        self._hwaccel = hwaccel or None
+
+    def _spawn_frame_job(
         self,
+        item: DatasetItem,
         *,
-        video_path: Path,
         fps: float,
         total_frames: int,
         tmp_dir: Path,
         final_dir: Path,
-    ) -> None:
-        self._cancel_frame_generation()
-        self._set_playing(False)
-        self._step_timer.stop()
-
+    ) -> _FrameJob:
         tmp_dir.parent.mkdir(parents=True, exist_ok=True)
         if tmp_dir.exists():
             shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -638,11 +1103,25 @@ class MainWindow(QMainWindow):
             "-nostdin",
             "-loglevel",
             "error",
-            "-i",
-            str(video_path.resolve()),
         ]
-        if fps > 0:
-            args.extend(["-vf", f"fps={fps:g}"])
+        hwaccel = self._hwaccel
+        if hwaccel is not None:
+            # Decoded frames are downloaded to system memory for the fps
+            # filter and the JPEG encoder, so no output format is forced.
+            args.extend(["-hwaccel", hwaccel])
+        args.extend(["-i", item.resolved_video])
+        filters = [f"fps={fps:g}"] if fps > 0 else []
+        max_size = self._frame_size_cap()
+        if max_size is not None:
+            # Frames never need to be larger than the biggest screen; smaller
+            # sources are left as they are.
+            max_w, max_h = max_size
+            filters.append(
+                f"scale=w='min(iw,{max_w})':h='min(ih,{max_h})'"
+                ":force_original_aspect_ratio=decrease"
+            )
+        if filters:
+            args.extend(["-vf", ",".join(filters)])
         args.extend(["-start_number", "0"])
         if total_frames > 0:
             args.extend(["-frames:v", str(total_frames)])
@@ -650,6 +1129,7 @@ class MainWindow(QMainWindow):
         args.extend(["-progress", "pipe:1", "-nostats"])
         args.append(output_pattern)
 
+        self._frame_job_serial += 1
         proc = QProcess(self)
         proc.setProgram(self._ffmpeg_path or "ffmpeg")
         proc.setArguments(args)
@@ -657,129 +1137,181 @@ class MainWindow(QMainWindow):
         proc.finished.connect(self._on_ffmpeg_finished)
         proc.start()
 
-        self._gen_process = proc
-        self._gen_stdout_buffer = ""
-        self._gen_tmp_dir = tmp_dir
-        self._gen_final_dir = final_dir
-        self._gen_expected_total_frames = int(total_frames) if total_frames > 0 else None
-        self._gen_expected_fps = float(fps) if fps > 0 else None
+        return _FrameJob(
+            process=proc,
+            item=item,
+            tmp_dir=tmp_dir,
+            final_dir=final_dir,
+            expected_total_frames=int(total_frames) if total_frames > 0 else None,
+            expected_fps=float(fps) if fps > 0 else None,
+            max_size=max_size,
+            serial=self._frame_job_serial,
+        )
+
+    def _adopt_frame_job(self, job: _FrameJob) -> None:
+        # Makes `job` the foreground generation for the current item, whether
+        # it was just spawned or was running as a preload.
+        self._set_playing(False)
+        self._step_timer.stop()
+        self._gen_job = job
 
-        self._pixmap_cache.clear()
-        self._frames_dir = None
+        self._set_frames_dir(None)
         self._set_controls_enabled(False)
         self._frame_view.setPixmap(QPixmap())
         self._frame_view.setText("Generating frames…")
 
-        if total_frames > 0:
-            self._status_progress.setRange(0, total_frames)
+        if job.expected_total_frames:
+            self._status_progress.setRange(0, job.expected_total_frames)
             self._status_progress.setValue(0)
         else:
             self._status_progress.setRange(0, 0)
         self._set_generation_status("Generating frames…", active=True)
 
+    def _preload_next_item(self) -> None:
+        if not self._config.preload_next_item or self._preload_job is not None:
+            return
+        if self._ffmpeg_path is None or self._current_item is None:
+            return
+        index = self._item_index_by_dir.get(self._current_item.resolved_dir_str)
+        if index is None or index + 1 >= len(self._items):
+            return
+        item = self._items[index + 1]
+
+        try:
+            info = read_json_cached(item.long_caption_path).get("info") or {}
+            fps = float(info.get("fps") or 10.0)
+            total_frames = int(info.get("total_frames") or 0)
+        except Exception:  # noqa: BLE001
+            return
+
+        frames_dir = self._frames_dir_for_item(item)
+        if self._frames_cache_valid(frames_dir, item, fps, total_frames):
+            return
+        self._preload_job = self._spawn_frame_job(
+            item,
+            fps=fps,
+            total_frames=total_frames,
+            tmp_dir=frames_dir.with_name(frames_dir.name + ".inprogress"),
+            final_dir=frames_dir,
+        )
+
     def _on_ffmpeg_stdout(self) -> None:
         proc = self.sender()
-        if proc is None or proc is not self._gen_process:
-            return
-        if self._gen_process is None:
+        job = self._gen_job
+        if proc is None or job is None or proc is not job.process:
+            if self._preload_job is not None and proc is self._preload_job.process:
+                self._preload_job.process.readAllStandardOutput()
             return
-        text = bytes(self._gen_process.readAllStandardOutput()).decode("utf-8", errors="ignore")
-        if not text:
+        buffer = job.stdout_buffer
+        buffer += job.process.readAllStandardOutput().data()
+        end = buffer.rfind(b"\n")
+        if end < 0:
             return
-        self._gen_stdout_buffer += text
-        while "\n" in self._gen_stdout_buffer:
-            line, rest = self._gen_stdout_buffer.split("\n", 1)
-            self._gen_stdout_buffer = rest
-            line = line.strip()
-            if not line or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            if key == "frame":
+        # -progress emits ASCII key=value lines in blocks; only the latest
+        # complete frame= line matters, so older ones are never converted.
+        frame = -1
+        for line in bytes(buffer[:end]).split(b"\n"):
+            if line.startswith(b"frame="):
                 try:
-                    frame = int(value)
+                    frame = int(line[6:])
                 except ValueError:
                     continue
-                self._update_generation_progress(frame)
+        del buffer[: end + 1]
+        if frame >= 0:
+            self._update_generation_progress(frame)
 
     def _update_generation_progress(self, frame: int) -> None:
-        if self._gen_expected_total_frames:
-            self._status_progress.setValue(min(frame, self._gen_expected_total_frames))
-            self._status_text.setText(f"Generating frames… {frame}/{self._gen_expected_total_frames}")
+        job = self._gen_job
+        if job is not None and frame > 0:
+            if job.expected_total_frames:
+                self._extend_partial_frames(job, min(frame, job.expected_total_frames))
+            elif not job.poster_shown:
+                self._show_poster_frame(job)
+        expected_total = job.expected_total_frames if job else None
+        if expected_total:
+            self._status_progress.setValue(min(frame, expected_total))
+            self._status_text.setText(f"Generating frames… {frame}/{expected_total}")
         else:
             self._status_text.setText(f"Generating frames… {frame}")
 
-    def _on_ffmpeg_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
-        proc = self.sender()
-        if proc is None or proc is not self._gen_process:
-            return
-
-        tmp_dir = self._gen_tmp_dir
-        final_dir = self._gen_final_dir
-        expected_total = self._gen_expected_total_frames
-        expected_fps = self._gen_expected_fps
-
-        self._gen_process = None
-        self._gen_tmp_dir = None
-        self._gen_final_dir = None
-        self._gen_expected_total_frames = None
-        self._gen_expected_fps = None
-        self._gen_stdout_buffer = ""
-
-        if exit_status != QProcess.ExitStatus.NormalExit or exit_code != 0:
-            if tmp_dir and tmp_dir.exists():
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-            self._set_generation_status("Frame generation failed.", active=False)
-            self._frame_view.setText("Frame generation failed")
+    def _extend_partial_frames(self, job: _FrameJob, written: int) -> None:
+        # ffmpeg reports a frame only once it has been written, so the frames
+        # extracted so far can be browsed from the tmp dir while the job runs;
+        # _max_frame follows the progress until the job finishes.
+        if self._frames_dir != job.tmp_dir:
+            self._set_frames_dir(job.tmp_dir, stamp=f"job{job.serial}")
+            self._max_frame = written - 1
+            self._frame_slider.setRange(0, self._max_frame)
+            self._set_controls_enabled(True)
+            self._frame_view.setText("")
+            self._display_frame(self._current_frame)
             return
-
-        if tmp_dir is None or final_dir is None:
-            self._set_generation_status("Frame generation finished (missing dirs).", active=False)
+        if written - 1 > self._max_frame:
+            self._max_frame = written - 1
+            self._frame_slider.setRange(0, self._max_frame)
+
+    def _show_poster_frame(self, job: _FrameJob) -> None:
+        # Without a known frame count the partial frames cannot be browsed, but
+        # the first JPEG can still stand in for the video.
+        job.poster_shown = True
+        pixmap = QPixmap(str(job.tmp_dir / "000000.jpg"))
+        if pixmap.isNull():
             return
+        self._current_base_pixmap = pixmap
+        self._frame_view.setText("")
+        self._set_frame_view_pixmap(pixmap)
 
-        if expected_total:
-            last = tmp_dir / f"{expected_total - 1:06d}.jpg"
+    def _finalize_frame_job(self, job: _FrameJob) -> int:
+        # Validates the extracted frames, writes meta.json and moves the
+        # directory into place. Returns the frame count.
+        tmp_dir = job.tmp_dir
+        if job.expected_total_frames:
+            last = tmp_dir / f"{job.expected_total_frames - 1:06d}.jpg"
             if not last.exists():
                 shutil.rmtree(tmp_dir, ignore_errors=True)
-                self._set_generation_status("Frame generation incomplete; regenerating needed.", active=False)
-                self._frame_view.setText("Frame generation incomplete")
-                return
-            total_frames = expected_total
+                raise _FrameJobError(
+                    "Frame generation incomplete; regenerating needed.",
+                    "Frame generation incomplete",
+                )
+            total_frames = job.expected_total_frames
         else:
-            frames = list(tmp_dir.glob("*.jpg"))
-            total_frames = len(frames)
+            total_frames, last_index = _scan_frames(tmp_dir)
             if total_frames <= 0:
                 shutil.rmtree(tmp_dir, ignore_errors=True)
-                self._set_generation_status("No frames generated.", active=False)
-                self._frame_view.setText("No frames generated")
-                return
-
-        self._status_progress.setRange(0, total_frames)
-        self._status_progress.setValue(total_frames)
+                raise _FrameJobError("No frames generated.", "No frames generated")
+            if last_index != total_frames - 1:
+                # Numbering has gaps; the frame indices would not line up.
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise _FrameJobError(
+                    "Frame generation incomplete; regenerating needed.",
+                    "Frame generation incomplete",
+                )
 
         try:
-            video_stat = (self._current_item.video_path if self._current_item else None).stat()  # type: ignore[union-attr]
-        except Exception:
+            video_stat = job.item.video_path.stat()
+        except OSError:
             video_stat = None
 
         meta: dict[str, Any] = {
             "generated_at": _utc_now_iso(),
-            "fps": float(expected_fps or self._fps),
+            "fps": float(job.expected_fps or self._fps),
             "total_frames": int(total_frames),
+            "video_path": job.item.resolved_video,
         }
-        if self._current_item is not None:
-            meta["video_path"] = str(self._current_item.video_path.resolve())
+        if job.max_size is not None:
+            meta["max_size"] = list(job.max_size)
         if video_stat is not None:
             meta["video_mtime_ns"] = int(video_stat.st_mtime_ns)
             meta["video_size"] = int(video_stat.st_size)
 
         try:
-            write_json_atomic(tmp_dir / "meta.json", meta)
+            # tmp_dir itself is renamed into place once meta.json is written.
+            write_json_atomic(tmp_dir / "meta.json", meta, atomic=False)
         except Exception:
             shutil.rmtree(tmp_dir, ignore_errors=True)
-            self._set_generation_status("Failed to write meta.json.", active=False)
-            self._frame_view.setText("Failed to write meta.json")
-            return
+            raise _FrameJobError("Failed to write meta.json.", "Failed to write meta.json")
 
+        final_dir = job.final_dir
         if final_dir.exists():
             shutil.rmtree(final_dir, ignore_errors=True)
         final_dir.parent.mkdir(parents=True, exist_ok=True)
@@ -787,46 +1319,102 @@ class MainWindow(QMainWindow):
             tmp_dir.replace(final_dir)
         except Exception as e:  # noqa: BLE001
             shutil.rmtree(tmp_dir, ignore_errors=True)
-            self._set_generation_status("Failed to finalize frame cache.", active=False)
-            QMessageBox.critical(self, "Cache failed", str(e))
+            raise _FrameJobError("Failed to finalize frame cache.", "", detail=str(e))
+        return total_frames
+
+    def _on_ffmpeg_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        proc = self.sender()
+        failed = exit_status != QProcess.ExitStatus.NormalExit or exit_code != 0
+
+        preload = self._preload_job
+        if preload is not None and proc is preload.process:
+            self._preload_job = None
+            if failed:
+                shutil.rmtree(preload.tmp_dir, ignore_errors=True)
+                return
+            try:
+                self._finalize_frame_job(preload)
+            except _FrameJobError:
+                pass
             return
 
-        self._frames_dir = final_dir
-        self._total_frames = total_frames
-        if self._total_frames > 0:
-            self._frame_slider.setRange(0, max(0, self._total_frames - 1))
-        self._set_controls_enabled(True)
-        self._set_generation_status("Frames ready.", active=False)
-        self._current_frame = 0
-        self._suppress_seek = True
-        self._frame_slider.setValue(0)
-        self._suppress_seek = False
-        self._update_frame_info(0)
-        self._display_frame(0)
+        job = self._gen_job
+        if proc is None or job is None or proc is not job.process:
+            return
+        self._gen_job = None
 
-    def _cancel_frame_generation(self) -> None:
-        if self._gen_process is None:
+        if failed:
+            self._drop_partial_frames(job)
+            if job.tmp_dir.exists():
+                shutil.rmtree(job.tmp_dir, ignore_errors=True)
+            self._set_generation_status("Frame generation failed.", active=False)
+            self._frame_view.setText("Frame generation failed")
+            return
+
+        try:
+            total_frames = self._finalize_frame_job(job)
+        except _FrameJobError as e:
+            self._drop_partial_frames(job)
+            self._set_generation_status(e.status, active=False)
+            if e.detail:
+                QMessageBox.critical(self, "Cache failed", e.detail)
+            else:
+                self._frame_view.setText(e.view_text)
             return
-        proc = self._gen_process
-        tmp_dir = self._gen_tmp_dir
 
+        self._status_progress.setRange(0, total_frames)
+        self._status_progress.setValue(total_frames)
+
+        # The user may already be browsing the partial frames; keep their place.
+        browsing = self._frames_dir == job.tmp_dir
+        self._set_frames_dir(job.final_dir)
+        self._set_total_frames(total_frames)
+        self._frame_slider.setRange(0, self._max_frame)
+        self._set_controls_enabled(True)
+        self._set_generation_status("Frames ready.", active=False)
+        if not browsing:
+            self._current_frame = 0
+        self._current_frame = min(self._current_frame, self._max_frame)
+        self._frame_slider.setValue(self._current_frame)
+        self._update_frame_info(self._current_frame)
+        self._display_frame(self._current_frame)
+        self._preload_next_item()
+
+    def _kill_frame_job(self, job: _FrameJob) -> None:
         try:
-            proc.kill()
-            proc.waitForFinished(1000)
+            job.process.kill()
+            job.process.waitForFinished(1000)
         except Exception:
             pass
+        if job.tmp_dir.exists():
+            shutil.rmtree(job.tmp_dir, ignore_errors=True)
 
-        self._gen_process = None
-        self._gen_tmp_dir = None
-        self._gen_final_dir = None
-        self._gen_expected_total_frames = None
-        self._gen_expected_fps = None
-        self._gen_stdout_buffer = ""
+    def _drop_partial_frames(self, job: _FrameJob) -> None:
+        if self._frames_dir != job.tmp_dir:
+            return
+        self._set_playing(False)
+        self._step_timer.stop()
+        self._set_frames_dir(None)
+        self._set_controls_enabled(False)
+        self._frame_view.setPixmap(QPixmap())
+        self._current_base_pixmap = None
 
-        if tmp_dir and tmp_dir.exists():
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+    def _cancel_frame_generation(self) -> None:
+        if self._gen_job is None:
+            return
+        job = self._gen_job
+        self._gen_job = None
+        self._drop_partial_frames(job)
+        self._kill_frame_job(job)
         self._set_generation_status("", active=False)
 
+    def _cancel_preload(self) -> None:
+        if self._preload_job is None:
+            return
+        job = self._preload_job
+        self._preload_job = None
+        self._kill_frame_job(job)
+
     def _set_generation_status(self, message: str, *, active: bool) -> None:
         self._status_text.setText(message)
         self._status_progress.setVisible(active)
@@ -841,40 +1429,96 @@ class MainWindow(QMainWindow):
 
     def _clear_frame_cache(self) -> None:
         self._cancel_frame_generation()
+        self._cancel_preload()
         self._set_playing(False)
         cache_root = self._frame_cache_root()
+        # Renaming the cache away is a single syscall; the files are unlinked
+        # on a worker thread so the window stays responsive. Leftovers of a
+        # removal cut short by quitting are picked up here as well.
+        doomed = sorted(cache_root.parent.glob(f"{cache_root.name}.deleting-*"))
         if cache_root.exists():
+            trash = cache_root.with_name(f"{cache_root.name}.deleting-{time.time_ns()}")
             try:
-                shutil.rmtree(cache_root)
+                cache_root.replace(trash)
             except Exception as e:  # noqa: BLE001
                 QMessageBox.critical(self, "Clear failed", str(e))
                 return
-        self._pixmap_cache.clear()
-        self._frames_dir = None
+            doomed.append(trash)
+        if doomed:
+            QThreadPool.globalInstance().start(_RemoveTreeTask(doomed))
+        QPixmapCache.clear()
+        self._set_frames_dir(None)
         self._frame_view.setPixmap(QPixmap())
         self._frame_view.setText("Frames cleared")
         self._set_generation_status("Frame cache cleared.", active=False)
         if self._current_item is not None:
             self._ensure_frames_for_current_item()
 
-    def _set_tree_reviewed_state(self, dir_path: Path, reviewed: bool) -> None:
-        indicator = self._review_indicator_by_dir.get(dir_path.resolve())
-        if indicator is None:
+    def _set_tree_reviewed_state(self, resolved_dir_str: str, reviewed: bool) -> None:
+        item_index = self._item_index_by_dir.get(resolved_dir_str)
+        if item_index is None:
             return
-        indicator.setChecked(bool(reviewed))
+        self._tree_model.set_reviewed(item_index, bool(reviewed))
+
+    def _set_reviewed_checkbox(self, reviewed: bool) -> None:
+        with qt_blocked(self._reviewed_checkbox):
+            self._reviewed_checkbox.setChecked(reviewed)
 
     def _on_reviewed_changed(self, state: int) -> None:
-        if self._current_item is None:
+        item = self._current_item
+        if item is None:
             return
         reviewed = Qt.CheckState(state) == Qt.CheckState.Checked
-        try:
-            long_caption = read_json(self._current_item.long_caption_path)
-            long_caption["reviewed"] = bool(reviewed)
-            write_json_atomic(self._current_item.long_caption_path, long_caption)
-        except Exception as e:  # noqa: BLE001
-            QMessageBox.critical(self, "Write failed", str(e))
+        self._set_tree_reviewed_state(item.resolved_dir_str, reviewed)
+        self._queue_reviewed_write(item, reviewed)
+
+    def _on_tree_reviewed_toggled(self, item_index: int, reviewed: bool) -> None:
+        item = self._items[item_index]
+        if item is self._current_item:
+            self._set_reviewed_checkbox(reviewed)
+        self._queue_reviewed_write(item, reviewed)
+
+    def _queue_reviewed_write(self, item: DatasetItem, reviewed: bool) -> None:
+        self._pending_reviewed[item.resolved_dir_str] = (item, reviewed)
+        if not self._reviewed_flush_timer.isActive():
+            self._reviewed_flush_timer.start()
+
+    def _flush_reviewed_writes(self) -> None:
+        busy: dict[str, tuple[DatasetItem, bool]] = {}
+        for key, (item, reviewed) in self._pending_reviewed.items():
+            if key in self._writing_reviewed:
+                busy[key] = (item, reviewed)
+                continue
+            self._writing_reviewed[key] = reviewed
+            self._write_pool.start(_ReviewedWriteTask(item, reviewed, self._write_signals))
+        # Items with a write still in flight go out on a later flush.
+        self._pending_reviewed = busy
+        if busy:
+            self._reviewed_flush_timer.start()
+
+    def _flush_reviewed_writes_now(self) -> None:
+        # Synchronous variant for shutdown; the pool must be idle.
+        pending = self._pending_reviewed
+        self._pending_reviewed = {}
+        for item, reviewed in pending.values():
+            try:
+                _write_reviewed(item, reviewed)
+            except Exception as e:  # noqa: BLE001
+                QMessageBox.critical(self, "Write failed", str(e))
+
+    def _on_reviewed_write_finished(self, key: str, reviewed: bool, error: str) -> None:
+        self._writing_reviewed.pop(key, None)
+        if not error:
+            return
+        QMessageBox.critical(self, "Write failed", error)
+        if key in self._pending_reviewed:
+            # A newer toggle is queued and will be written anyway.
             return
-        self._set_tree_reviewed_state(self._current_item.dir_path.resolve(), bool(reviewed))
+        # Revert the UI to what is still on disk.
+        self._set_tree_reviewed_state(key, not reviewed)
+        current = self._current_item
+        if current is not None and current.resolved_dir_str == key:
+            self._set_reviewed_checkbox(not reviewed)
 
     def _open_current_json(self) -> None:
         if self._current_item is None:
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QAbstractItemModel, QEvent, QModelIndex, QPersistentModelIndex, QRect, Qt
+from PySide6.QtGui import QMouseEvent, QPainter
+from PySide6.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+
+REVIEWED_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def _indicator_rect(style: QStyle, cell: QRect, widget: QWidget | None) -> QRect:
+    width = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorWidth, None, widget)
+    height = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorHeight, None, widget)
+    rect = QRect(0, 0, width, height)
+    rect.moveCenter(cell.center())
+    return rect
+
+
+# Paints a centered check indicator from REVIEWED_ROLE, replacing a QCheckBox
+# item widget per row. Clicking the indicator of a user-checkable index writes
+# the toggled value back through setData(..., REVIEWED_ROLE).
+class ReviewedDelegate(QStyledItemDelegate):
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        reviewed = index.data(REVIEWED_ROLE)
+        if reviewed is None:
+            super().paint(painter, option, index)
+            return
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, widget)
+
+        check = QStyleOptionButton()
+        check.rect = _indicator_rect(style, opt.rect, widget)
+        check.state = QStyle.StateFlag.State_Enabled | (
+            QStyle.StateFlag.State_On if reviewed else QStyle.StateFlag.State_Off
+        )
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorCheckBox, check, painter, widget)
+
+    def editorEvent(  # noqa: N802
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> bool:
+        if not index.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            return super().editorEvent(event, model, option, index)
+        reviewed = index.data(REVIEWED_ROLE)
+        if reviewed is None or event.type() not in (
+            QEvent.Type.MouseButtonRelease,
+            QEvent.Type.MouseButtonDblClick,
+        ):
+            return super().editorEvent(event, model, option, index)
+        if not isinstance(event, QMouseEvent) or event.button() != Qt.MouseButton.LeftButton:
+            return False
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        if not _indicator_rect(style, option.rect, widget).contains(event.position().toPoint()):
+            return False
+        if event.type() == QEvent.Type.MouseButtonDblClick:
+            # Swallow the second click of a double click so it cannot expand
+            # or activate the row; the release already toggled.
+            return True
+        return model.setData(index, not reviewed, REVIEWED_ROLE)
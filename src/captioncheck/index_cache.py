@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from .dataset import (
+    SKIP_SPORT_DIRS,
+    DatasetItem,
+    is_event_dir,
+    make_dataset_item,
+    scan_sport,
+    sorted_subdirs,
+)
+from .json_cache import reviewed_flag_stamp, seed_reviewed_flag
+from .json_io import read_json, write_json_atomic
+
+
+INDEX_VERSION = 2
+INDEX_FILENAME = ".captioncheck_index.json"
+
+
+def index_path(data_root: Path) -> Path:
+    return data_root / INDEX_FILENAME
+
+
+def _sport_entries(data_root: Path) -> list[os.DirEntry[str]]:
+    return [e for e in sorted_subdirs(data_root) if e.name not in SKIP_SPORT_DIRS]
+
+
+def _load_sport(
+    data_root: Path, sport_name: str, resolved_root: Path, cached_sport: Any
+) -> tuple[list[DatasetItem], list[tuple[Path, int, int, bool]]] | None:
+    # The sport's items and reviewed seeds from the index, or None when any of
+    # its directories changed since the index was written.
+    sport_dir = data_root / sport_name
+    if os.stat(sport_dir).st_mtime_ns != cached_sport["mtime_ns"]:
+        return None
+    resolved_sport_dir = resolved_root / sport_name
+    items: list[DatasetItem] = []
+    seeds: list[tuple[Path, int, int, bool]] = []
+    for event, cached_event in cached_sport["events"].items():
+        event_dir = sport_dir / event
+        if os.stat(event_dir).st_mtime_ns != cached_event["mtime_ns"]:
+            return None
+        caption = cached_event["caption"]
+        if caption is None:
+            continue
+        item = make_dataset_item(
+            sport_dir, event, resolved_sport_dir if cached_event["direct"] else None
+        )
+        items.append(item)
+        if caption:
+            mtime_ns, size, reviewed = caption
+            seeds.append((item.long_caption_path, int(mtime_ns), int(size), bool(reviewed)))
+    return items, seeds
+
+
+def load_index(data_root: Path) -> dict[str, list[DatasetItem]] | None:
+    # A directory's mtime changes whenever entries are added to or removed from
+    # it, so matching sport/event mtimes mean a rescan would find the same
+    # items. Only sports that changed (or are new) are rescanned. Cached
+    # reviewed flags are seeded into json_cache, which still checks them
+    # against the caption file's own mtime/size on read. None when there is no
+    # usable index at all; the caller then scans the whole dataset.
+    try:
+        raw = read_json(index_path(data_root))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("version") != INDEX_VERSION:
+        return None
+    sports = raw.get("sports")
+    if not isinstance(sports, dict):
+        return None
+
+    try:
+        sport_entries = _sport_entries(data_root)
+        resolved_root = data_root.resolve()
+    except OSError:
+        return None
+    items_by_sport: dict[str, list[DatasetItem]] = {}
+    seeds: list[tuple[Path, int, int, bool]] = []
+    for sport_entry in sport_entries:
+        loaded = None
+        cached_sport = sports.get(sport_entry.name)
+        if cached_sport is not None:
+            try:
+                loaded = _load_sport(data_root, sport_entry.name, resolved_root, cached_sport)
+            except (OSError, AttributeError, KeyError, TypeError, ValueError):
+                loaded = None
+        if loaded is None:
+            try:
+                is_link = sport_entry.is_symlink()
+                items = scan_sport(
+                    data_root / sport_entry.name,
+                    None if is_link else resolved_root / sport_entry.name,
+                )
+            except OSError:
+                return None
+        else:
+            items, sport_seeds = loaded
+            seeds.extend(sport_seeds)
+        if items:
+            items_by_sport[sport_entry.name] = items
+
+    for path, mtime_ns, size, reviewed in seeds:
+        seed_reviewed_flag(path, mtime_ns, size, reviewed)
+    return items_by_sport
+
+
+def _caption_entry(item: DatasetItem) -> list[Any]:
+    # Only flags already resolved this session are persisted; reading the
+    # rest here would put a stat and a read per unseen item on shutdown. An
+    # empty entry loads as an item without a seed. Stamps are re-checked
+    # against the caption file when they are read, so none is stat'ed here.
+    stamp = reviewed_flag_stamp(item.long_caption_path)
+    if stamp is None:
+        return []
+    return [stamp[0], stamp[1], stamp[2]]
+
+
+def _is_direct(item: DatasetItem, resolved_sport_dir: Path) -> bool:
+    # Whether the item's resolved paths are plain joins onto the resolved
+    # sport directory, so load_index can rebuild them without resolve().
+    resolved_dir_str = str(resolved_sport_dir / item.event)
+    return (
+        item.resolved_dir_str == resolved_dir_str
+        and item.resolved_video == str(Path(resolved_dir_str) / "segment.mp4")
+    )
+
+
+def save_index(data_root: Path, items: list[DatasetItem]) -> None:
+    item_by_dir = {item.dir_path: item for item in items}
+    resolved_root = data_root.resolve()
+    sports: dict[str, Any] = {}
+    for sport_entry in _sport_entries(data_root):
+        sport_dir = data_root / sport_entry.name
+        resolved_sport_dir = resolved_root / sport_entry.name
+        events: dict[str, Any] = {}
+        for event_entry in sorted_subdirs(sport_dir):
+            item = item_by_dir.get(sport_dir / event_entry.name)
+            mtime_ns = event_entry.stat().st_mtime_ns
+            direct = False
+            if item is not None:
+                caption = _caption_entry(item)
+                direct = _is_direct(item, resolved_sport_dir)
+            elif is_event_dir(event_entry.path):
+                # Became a complete event after the scan; force a rescan.
+                mtime_ns, caption = 0, None
+            else:
+                caption = None
+            events[event_entry.name] = {
+                "mtime_ns": mtime_ns,
+                "caption": caption,
+                "direct": direct,
+            }
+        sports[sport_entry.name] = {
+            "mtime_ns": sport_entry.stat().st_mtime_ns,
+            "events": events,
+        }
+
+    # The index is a cache: a torn write fails to parse and triggers a rescan.
+    write_json_atomic(
+        index_path(data_root), {"version": INDEX_VERSION, "sports": sports}, atomic=False
+    )
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .json_io import read_json
+from .reviewed_flag import read_reviewed_tail
+
+
+# path -> (st_mtime_ns, st_size, parsed data). Entries are replaced as soon as
+# the file on disk changes, so there is at most one entry per path; the least
+# recently used entries are dropped beyond _CACHE_SIZE parsed files.
+_CACHE_SIZE = 64
+_cache: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+# Reviewed flags are resolved on worker threads, so the LRU bookkeeping is
+# serialised; the parse itself runs outside the lock.
+_cache_lock = threading.Lock()
+# path -> (st_mtime_ns, st_size, reviewed). Kept separately so the flag can be
+# seeded from the dataset index without parsing the file.
+_reviewed: dict[str, tuple[int, int, bool]] = {}
+
+
+def read_json_cached(path: Path) -> Any:
+    # The returned object is shared between callers; copy before mutating.
+    key = str(path)
+    st = os.stat(key)
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            _cache.move_to_end(key)
+            return entry[2]
+    data = read_json(path)
+    with _cache_lock:
+        _cache[key] = (st.st_mtime_ns, st.st_size, data)
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return data
+
+
+def read_reviewed_flag(path: Path) -> bool:
+    key = str(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return False
+    entry = _reviewed.get(key)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+    reviewed = read_reviewed_tail(path)
+    if reviewed is None:
+        try:
+            data = read_json_cached(path)
+        except Exception:  # noqa: BLE001
+            return False
+        reviewed = bool(data.get("reviewed", False)) if isinstance(data, dict) else False
+    _reviewed[key] = (st.st_mtime_ns, st.st_size, reviewed)
+    return reviewed
+
+
+def reviewed_flag_stamp(path: Path) -> tuple[int, int, bool] | None:
+    return _reviewed.get(str(path))
+
+
+def seed_reviewed_flag(path: Path, mtime_ns: int, size: int, reviewed: bool) -> None:
+    _reviewed[str(path)] = (int(mtime_ns), int(size), bool(reviewed))
+
+
+def invalidate(path: Path) -> None:
+    key = str(path)
+    with _cache_lock:
+        _cache.pop(key, None)
+    _reviewed.pop(key, None)
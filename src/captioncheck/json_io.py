@@ -5,23 +5,51 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 
 def read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    # Raw bytes straight into the parser; json.loads detects UTF-8 itself.
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
+def _dumps(data: Any) -> bytes:
+    # The whole document, trailing newline included, as one buffer so it goes
+    # out in a single write().
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: stringify int keys like the json fallback does.
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
 
-def write_json_atomic(path: Path, data: Any) -> None:
+
+def write_bytes_atomic(path: Path, data: bytes, *, atomic: bool = True) -> None:
+    # atomic=False writes in place, skipping the temp file and rename; only for
+    # files whose readers treat a torn write as "missing" and rebuild them.
     path.parent.mkdir(parents=True, exist_ok=True)
+    if not atomic:
+        with open(path, "wb") as f:
+            f.write(data)
+        return
     with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
+        mode="wb",
         dir=str(path.parent),
         delete=False,
         prefix=f".{path.name}.",
         suffix=".tmp",
     ) as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+        f.write(data)
         tmp_path = Path(f.name)
     tmp_path.replace(path)
 
+
+def write_json_atomic(path: Path, data: Any, *, atomic: bool = True) -> None:
+    write_bytes_atomic(path, _dumps(data), atomic=atomic)
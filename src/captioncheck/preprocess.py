@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from .dataset import DatasetItem, iter_dataset_items
-from .json_io import read_json, write_json_atomic
+from .json_io import read_json, write_bytes_atomic, write_json_atomic
 
 
 PREPROCESS_VERSION = 1
 
+# Below this many pending items a process pool costs more to start than the
+# work it would spread out.
+_PARALLEL_MIN_ITEMS = 8
+
 
 @dataclass(frozen=True)
 class PreprocessResult:
@@ -23,16 +32,46 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
-def preprocess_item(item: DatasetItem) -> PreprocessResult:
+def _as_int(value: Any) -> int:
+    # Parsed JSON numbers are almost always ints already; only the rest goes
+    # through int(), which rejects null and other malformed values.
+    if type(value) is int:
+        return value
+    return int(value)
+
+
+def _status_bytes(
+    preprocessed_at: str, original_starting_frame: int, total_frames: int, shifted: bool
+) -> bytes:
+    # preprocess_status.json has a fixed shape of ints, a bool and an ISO
+    # timestamp, none of which need escaping, so it is formatted directly.
+    return (
+        "{\n"
+        f'  "preprocess_version": {PREPROCESS_VERSION},\n'
+        f'  "preprocessed_at": "{preprocessed_at}",\n'
+        f'  "original_starting_frame": {original_starting_frame},\n'
+        f'  "total_frames": {total_frames},\n'
+        f'  "shifted_spans": {"true" if shifted else "false"}\n'
+        "}\n"
+    ).encode("ascii")
+
+
+def _skipped(item: DatasetItem) -> PreprocessResult:
+    return PreprocessResult(item=item, status="skipped", message="already preprocessed")
+
+
+def preprocess_item(item: DatasetItem, preprocessed_at: str | None = None) -> PreprocessResult:
+    # preprocessed_at lets a batch stamp all its items with one timestamp.
     if item.preprocess_status_path.exists():
-        return PreprocessResult(item=item, status="skipped", message="already preprocessed")
+        return _skipped(item)
 
     try:
         long_caption: dict[str, Any] = read_json(item.long_caption_path)
         info = long_caption.get("info") or {}
-        original_starting_frame = int(info.get("original_starting_frame") or 0)
-        total_frames = int(info.get("total_frames") or 0)
-        spans: list[dict[str, Any]] = list(long_caption.get("spans") or [])
+        original_starting_frame = _as_int(info.get("original_starting_frame") or 0)
+        total_frames = _as_int(info.get("total_frames") or 0)
+        # Not copied: the shift below rewrites the span dicts in place.
+        spans: list[dict[str, Any]] = long_caption.get("spans") or []
 
         changed = False
 
@@ -42,43 +81,79 @@ def preprocess_item(item: DatasetItem) -> PreprocessResult:
 
         needs_shift = False
         if spans and original_starting_frame and total_frames:
-            max_end = max(int(s.get("end_frame", 0)) for s in spans)
-            min_start = min(int(s.get("start_frame", 0)) for s in spans)
+            # One pass for both bounds.
+            first = spans[0]
+            max_end = _as_int(first.get("end_frame", 0))
+            min_start = _as_int(first.get("start_frame", 0))
+            for s in spans:
+                end = _as_int(s.get("end_frame", 0))
+                start = _as_int(s.get("start_frame", 0))
+                if end > max_end:
+                    max_end = end
+                if start < min_start:
+                    min_start = start
             if max_end > total_frames + 2 and min_start >= original_starting_frame - 2:
                 needs_shift = True
 
         if needs_shift:
+            offset = original_starting_frame
             for span in spans:
-                start = int(span.get("start_frame", 0)) - original_starting_frame
-                end = int(span.get("end_frame", 0)) - original_starting_frame
-                if start < 0:
-                    start = 0
-                if end < 0:
-                    end = 0
-                span["start_frame"] = start
-                span["end_frame"] = end
-            long_caption["spans"] = spans
+                start = _as_int(span.get("start_frame", 0)) - offset
+                end = _as_int(span.get("end_frame", 0)) - offset
+                span["start_frame"] = start if start > 0 else 0
+                span["end_frame"] = end if end > 0 else 0
             changed = True
 
         if changed:
             write_json_atomic(item.long_caption_path, long_caption)
 
-        status_payload = {
-            "preprocess_version": PREPROCESS_VERSION,
-            "preprocessed_at": _utc_now_iso(),
-            "original_starting_frame": original_starting_frame,
-            "total_frames": total_frames,
-            "shifted_spans": bool(needs_shift),
-        }
-        write_json_atomic(item.preprocess_status_path, status_payload)
+        write_bytes_atomic(
+            item.preprocess_status_path,
+            _status_bytes(
+                preprocessed_at or _utc_now_iso(),
+                original_starting_frame,
+                total_frames,
+                needs_shift,
+            ),
+        )
         return PreprocessResult(item=item, status="processed", message="ok")
     except Exception as e:  # noqa: BLE001
         return PreprocessResult(item=item, status="error", message=str(e))
 
 
-def preprocess_dataset(data_root: Path) -> list[PreprocessResult]:
-    results: list[PreprocessResult] = []
-    for item in iter_dataset_items(data_root):
-        results.append(preprocess_item(item))
-    return results
+def _iter_preprocess(items: list[DatasetItem], preprocessed_at: str) -> Iterator[PreprocessResult]:
+    # Items are independent, so they are spread over worker processes and the
+    # results streamed back in order. When no pool can be started, or it
+    # breaks, the rest run serially (items a broken pool already finished are
+    # then reported as skipped).
+    done = 0
+    workers = min(len(items), os.cpu_count() or 1)
+    if len(items) >= _PARALLEL_MIN_ITEMS and workers > 1:
+        chunksize = max(1, min(32, len(items) // (workers * 4)))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                run = partial(preprocess_item, preprocessed_at=preprocessed_at)
+                for result in executor.map(run, items, chunksize=chunksize):
+                    yield result
+                    done += 1
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass
+    for item in items[done:]:
+        yield preprocess_item(item, preprocessed_at)
+
+
+def iter_preprocess_dataset(data_root: Path) -> Iterator[PreprocessResult]:
+    # Results in dataset order, produced as they complete; callers that only
+    # look at errors need not hold every result.
+    items = iter_dataset_items(data_root)
+    # The "already preprocessed" check is one stat; only items that need
+    # work are worth handing to other processes.
+    is_done = [item.preprocess_status_path.exists() for item in items]
+    pending = [item for item, skip in zip(items, is_done) if not skip]
+    results = _iter_preprocess(pending, _utc_now_iso())
+    for item, skip in zip(items, is_done):
+        yield _skipped(item) if skip else next(results)
 
+
+def preprocess_dataset(data_root: Path) -> list[PreprocessResult]:
+    return list(iter_preprocess_dataset(data_root))
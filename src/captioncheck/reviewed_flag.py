@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+
+# long_caption.json is the only record of the reviewed state. Preprocessing
+# and every GUI rewrite put "reviewed" last, so in the common case the state
+# can be read from the last few bytes. A match has to be followed only by the
+# closing brace of the document, which makes it the top-level key rather than
+# one nested in the spans. Whitespace between the
+# value and the brace is room to patch it in place (see patch_reviewed_tail).
+_TAIL_BYTES = 256
+_TAIL_REVIEWED_RE = re.compile(rb'(?<!\\)"reviewed"\s*:\s*(true|false)(\s*)\}\s*\Z')
+
+
+def read_reviewed_tail(caption_path: Path) -> bool | None:
+    # None when the file does not end with the reviewed key; the caller then
+    # falls back to a full parse.
+    try:
+        with open(caption_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > _TAIL_BYTES:
+                f.seek(size - _TAIL_BYTES)
+            tail = f.read()
+    except OSError:
+        return None
+    match = _TAIL_REVIEWED_RE.search(tail)
+    if match is None:
+        return None
+    return match.group(1) == b"true"
+
+
+def patch_reviewed_tail(caption_path: Path, reviewed: bool) -> bool:
+    # Overwrites the trailing reviewed value in place when the new literal fits
+    # in the old one plus the whitespace before the closing brace, e.g.
+    # `false\n}` -> `true  }` and `true\n}` -> `false}`. Returns False when
+    # the file has to be rewritten instead.
+    value = b"true" if reviewed else b"false"
+    with open(caption_path, "r+b") as f:
+        size = os.fstat(f.fileno()).st_size
+        start = max(0, size - _TAIL_BYTES)
+        f.seek(start)
+        match = _TAIL_REVIEWED_RE.search(f.read())
+        if match is None:
+            return False
+        slot = match.end(2) - match.start(1)
+        if len(value) > slot:
+            return False
+        f.seek(start + match.start(1))
+        f.write(value.ljust(slot))
+        # The file's size never changes, so make the toggle durable before the
+        # caller records the new state against the file's stamp.
+        f.flush()
+        os.fsync(f.fileno())
+    return True
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import subprocess
+import unittest
+from unittest import mock
+
+from captioncheck.ffmpeg_hwaccel import detect_hwaccel
+
+
+_HWACCELS_OUTPUT = "Hardware acceleration methods:\nvdpau\nvaapi\nqsv\n"
+
+
+def _completed(stdout: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr="")
+
+
+class DetectHwaccelTest(unittest.TestCase):
+    def test_auto_picks_the_first_preferred_method(self) -> None:
+        with mock.patch("subprocess.run", return_value=_completed(_HWACCELS_OUTPUT)):
+            self.assertEqual(detect_hwaccel("ffmpeg", "auto"), "vaapi")
+
+    def test_requested_method_must_be_listed(self) -> None:
+        with mock.patch("subprocess.run", return_value=_completed(_HWACCELS_OUTPUT)):
+            self.assertEqual(detect_hwaccel("ffmpeg", "qsv"), "qsv")
+            self.assertIsNone(detect_hwaccel("ffmpeg", "cuda"))
+
+    def test_timeout_falls_back_to_software(self) -> None:
+        timeout = subprocess.TimeoutExpired(cmd="ffmpeg", timeout=5)
+        with mock.patch("subprocess.run", side_effect=timeout):
+            self.assertIsNone(detect_hwaccel("ffmpeg", "auto"))
+
+    def test_os_error_falls_back_to_software(self) -> None:
+        with mock.patch("subprocess.run", side_effect=OSError("not executable")):
+            self.assertIsNone(detect_hwaccel("ffmpeg", "auto"))
+
+
+if __name__ == "__main__":
+    unittest.main()
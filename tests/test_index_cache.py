@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from captioncheck import index_cache
+from captioncheck.dataset import flatten_items, scan_dataset
+from captioncheck.index_cache import load_index, save_index
+
+
+def _make_event(data_root: Path, sport: str, event: str) -> None:
+    event_dir = data_root / sport / event
+    event_dir.mkdir(parents=True)
+    (event_dir / "segment.mp4").write_bytes(b"")
+    (event_dir / "run_meta.json").write_text("{}\n", encoding="utf-8")
+    (event_dir / "long_caption.json").write_text(
+        '{"info": {}, "spans": [], "reviewed": false}\n', encoding="utf-8"
+    )
+
+
+def _events(items_by_sport: dict[str, list]) -> dict[str, list[str]]:
+    return {sport: [item.event for item in items] for sport, items in items_by_sport.items()}
+
+
+class LoadIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_root = Path(tmp.name)
+        _make_event(self.data_root, "basketball", "game_1")
+        _make_event(self.data_root, "soccer", "match_1")
+        save_index(self.data_root, flatten_items(scan_dataset(self.data_root)))
+
+    def test_unchanged_dataset_is_not_rescanned(self) -> None:
+        with mock.patch.object(index_cache, "scan_sport") as scan_sport:
+            items_by_sport = load_index(self.data_root)
+
+        scan_sport.assert_not_called()
+        self.assertEqual(
+            _events(items_by_sport), {"basketball": ["game_1"], "soccer": ["match_1"]}
+        )
+
+    def test_only_changed_sports_are_rescanned(self) -> None:
+        _make_event(self.data_root, "soccer", "match_2")
+        # Make sure the directory mtime moves even on coarse-grained clocks.
+        soccer = self.data_root / "soccer"
+        mtime_ns = os.stat(soccer).st_mtime_ns + 1_000_000_000
+        os.utime(soccer, ns=(mtime_ns, mtime_ns))
+
+        with mock.patch.object(
+            index_cache, "scan_sport", wraps=index_cache.scan_sport
+        ) as scan_sport:
+            items_by_sport = load_index(self.data_root)
+
+        self.assertEqual([call.args[0].name for call in scan_sport.call_args_list], ["soccer"])
+        self.assertEqual(
+            _events(items_by_sport),
+            {"basketball": ["game_1"], "soccer": ["match_1", "match_2"]},
+        )
+
+    def test_new_sport_is_scanned(self) -> None:
+        _make_event(self.data_root, "tennis", "set_1")
+
+        items_by_sport = load_index(self.data_root)
+
+        self.assertEqual(_events(items_by_sport)["tennis"], ["set_1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
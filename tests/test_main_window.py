@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from PySide6.QtWidgets import QApplication
+except ImportError:  # pragma: no cover - GUI tests need PySide6
+    QApplication = None  # type: ignore[assignment,misc]
+
+from captioncheck.config import AppConfig, ExternalEditorConfig
+
+
+def _make_event(sport_dir: Path, event: str, video: Path) -> None:
+    event_dir = sport_dir / event
+    event_dir.mkdir(parents=True)
+    (event_dir / "segment.mp4").symlink_to(video)
+    (event_dir / "long_caption.json").write_text(
+        '{"info": {"fps": 10, "total_frames": 0}, "spans": [], "reviewed": false}\n',
+        encoding="utf-8",
+    )
+    (event_dir / "run_meta.json").write_text("{}\n", encoding="utf-8")
+
+
+@unittest.skipIf(QApplication is None, "PySide6 is not installed")
+class LoadItemTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_root = Path(tmp.name) / "data"
+        shared_video = Path(tmp.name) / "shared.mp4"
+        shared_video.write_bytes(b"")
+        for event in ("event_a", "event_b"):
+            _make_event(self.data_root / "soccer", event, shared_video)
+
+    def test_events_sharing_a_video_are_distinct_items(self) -> None:
+        from captioncheck.gui.main_window import MainWindow
+
+        window = MainWindow(AppConfig(self.data_root, ExternalEditorConfig()))
+        self.addCleanup(window.close)
+        first, second = window._items
+        self.assertEqual(first.resolved_video, second.resolved_video)
+
+        window._load_item(first)
+        window._load_item(second)
+
+        self.assertIs(window._current_item, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from captioncheck.dataset import flatten_items, scan_dataset
+from captioncheck.preprocess import preprocess_item
+
+
+class PreprocessItemTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_root = Path(tmp.name)
+
+    def _make_item(self, caption: dict[str, object]):
+        event_dir = self.data_root / "soccer" / "event"
+        event_dir.mkdir(parents=True)
+        (event_dir / "segment.mp4").write_bytes(b"")
+        (event_dir / "run_meta.json").write_text("{}\n", encoding="utf-8")
+        (event_dir / "long_caption.json").write_text(json.dumps(caption), encoding="utf-8")
+        (item,) = flatten_items(scan_dataset(self.data_root))
+        return item
+
+    def test_shifts_spans_by_the_starting_frame(self) -> None:
+        item = self._make_item(
+            {
+                "info": {"original_starting_frame": 100, "total_frames": 50},
+                "spans": [{"start_frame": 100, "end_frame": 160}],
+            }
+        )
+
+        result = preprocess_item(item)
+
+        self.assertEqual(result.status, "processed")
+        caption = json.loads(item.long_caption_path.read_text(encoding="utf-8"))
+        self.assertEqual(caption["spans"], [{"start_frame": 0, "end_frame": 60}])
+        self.assertFalse(caption["reviewed"])
+        status = json.loads(item.preprocess_status_path.read_text(encoding="utf-8"))
+        self.assertTrue(status["shifted_spans"])
+
+    def test_null_end_frame_is_reported_as_an_error(self) -> None:
+        caption = {
+            "info": {"original_starting_frame": 100, "total_frames": 50},
+            "spans": [{"start_frame": 100, "end_frame": None}],
+        }
+        item = self._make_item(caption)
+        before = item.long_caption_path.read_bytes()
+
+        result = preprocess_item(item)
+
+        self.assertEqual(result.status, "error")
+        self.assertEqual(item.long_caption_path.read_bytes(), before)
+        self.assertFalse(item.preprocess_status_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()